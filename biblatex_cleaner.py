@@ -8,11 +8,13 @@ import re
 import sys
 import os
 import argparse
-from typing import Dict, List, Tuple, Optional, Set
+import hashlib
+import pickle
+from typing import Dict, List, Tuple, Optional, Set, FrozenSet
 from datetime import datetime
-from difflib import SequenceMatcher
+from functools import lru_cache
+from collections import Counter
 from pybtex.database import parse_file, BibliographyData, Entry
-from pybtex.database.output.bibtex import Writer
 
 
 def clean_filepath(filepath: str) -> str:
@@ -128,7 +130,7 @@ BIBTEX_TO_BIBLATEX = {
 BIBLATEX_TO_BIBTEX = {v: k for k, v in BIBTEX_TO_BIBLATEX.items()}
 
 # Known valid BibTeX/BibLaTeX field names (for detecting typos/forbidden fields)
-KNOWN_FIELDS = {
+KNOWN_FIELDS = frozenset({
     # Standard fields (both BibTeX and BibLaTeX)
     'author', 'title', 'year', 'month', 'day',
     'editor', 'publisher', 'organization', 'institution', 'school',
@@ -171,7 +173,7 @@ KNOWN_FIELDS = {
     'shortjournal', 'shortseries', 'shorttitle', 'sortkey', 'sortname',
     'sortshorthand', 'sorttitle', 'sortyear', 'usera', 'userb', 'userc',
     'userd', 'usere', 'userf', 'verba', 'verbb', 'verbc',
-}
+})
 
 # Recommended fields for completeness (can use same alternative format as required fields)
 RECOMMENDED_FIELDS = {
@@ -180,28 +182,254 @@ RECOMMENDED_FIELDS = {
     'inproceedings': ['pages', ['publisher'], 'doi'],
 }
 
+# Problematic unicode characters and their LaTeX replacements
+# (smart quotes are written as escapes so editors cannot turn them into ASCII quotes)
+PROBLEMATIC_CHARS = {
+    '—': 'em-dash (use ---)',
+    '–': 'en-dash (use --)',
+    '\u2018': 'smart quote (use `)',
+    '\u2019': 'smart quote (use \')',
+    '\u201c': 'smart quote (use ``)',
+    '\u201d': 'smart quote (use \'\')',
+    '…': 'ellipsis (use ...)',
+}
+
+# Unescaped accented characters and their LaTeX forms
+ACCENT_CHARS = {
+    'á': r"\'a", 'à': r"\`a", 'ä': r'\"a', 'â': r"\^a", 'ã': r"\~a",
+    'Á': r"\'A", 'À': r"\`A", 'Ä': r'\"A', 'Â': r"\^A", 'Ã': r"\~A",
+    'é': r"\'e", 'è': r"\`e", 'ë': r'\"e', 'ê': r"\^e",
+    'É': r"\'E", 'È': r"\`E", 'Ë': r'\"E', 'Ê': r"\^E",
+    'í': r"\'i", 'ì': r"\`i", 'ï': r'\"i', 'î': r"\^i",
+    'Í': r"\'I", 'Ì': r"\`I", 'Ï': r'\"I', 'Î': r"\^I",
+    'ó': r"\'o", 'ò': r"\`o", 'ö': r'\"o', 'ô': r"\^o", 'õ': r"\~o",
+    'Ó': r"\'O", 'Ò': r"\`O", 'Ö': r'\"O', 'Ô': r"\^O", 'Õ': r"\~O",
+    'ú': r"\'u", 'ù': r"\`u", 'ü': r'\"u', 'û': r"\^u",
+    'Ú': r"\'U", 'Ù': r"\`U", 'Ü': r'\"U', 'Û': r"\^U",
+    'ñ': r"\~n", 'Ñ': r"\~N",
+    'ç': r"\c{c}", 'Ç': r"\c{C}",
+    'ß': r"\ss",
+}
+
+# All table entries are single code points, so membership is a set lookup
+_PROBLEMATIC_CHARSET = frozenset(PROBLEMATIC_CHARS)
+_ACCENT_CHARSET = frozenset(ACCENT_CHARS)
+_ESCAPE_CHARS = '&%_'
+_ESCAPE_CHARSET = frozenset(_ESCAPE_CHARS)
+_SPECIAL_CHARSET = _PROBLEMATIC_CHARSET | _ACCENT_CHARSET | _ESCAPE_CHARSET
+
+# Table position of every flagged character, so hits can be reported in
+# table order without walking the whole table
+_SPECIAL_CHAR_ORDER = {char: pos for pos, char in enumerate([*PROBLEMATIC_CHARS, *ACCENT_CHARS])}
+
+# Templates for the per-field and per-name checks. These run on every field
+# or person, so their messages are stored as (template, *args) and only
+# formatted when the report is written
+_MSG_UNICODE = "Entry {}, field '{}': Contains {} ('{}')"
+_MSG_AMPERSAND = "Entry {}, field '{}': Contains unescaped ampersand (use \\&)"
+_MSG_UNDERSCORE = "Entry {}, field '{}': May contain unescaped underscore (use \\_)"
+_MSG_PERCENT = "Entry {}, field '{}': Contains unescaped percent sign (use \\%)"
+_MSG_ACCENTS = "Entry {}, field '{}': Unescaped accents: {}"
+_MSG_NAME_SINGLE_WORD = "Entry {}, {} #{} '{}': Single-word name (check parsing)"
+_MSG_NAME_DIGITS = "Entry {}, {} #{} '{}': Contains numbers"
+_MSG_NAME_UNUSUAL = "Entry {}, {} #{} '{}': Contains unusual characters"
+
+# Where parsed .bib files are cached between runs (opt-in via --cache)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'biblatex_check')
+
+# BibTeX/BibLaTeX field pairs that duplicate each other: (dropped, kept)
+_DUPLICATE_FIELD_PAIRS = (('journal', 'journaltitle'), ('year', 'date'))
+_DUPLICATE_FIELDS = frozenset(name for pair in _DUPLICATE_FIELD_PAIRS for name in pair)
+
+# Per-entry checks run by BibTeXCleaner.check_entry
+ENTRY_CHECKS = frozenset({
+    'unicode', 'ampersand', 'special', 'accents', 'names', 'entry_types',
+    'unknown_fields', 'dates', 'identifiers', 'consistency', 'completeness',
+})
+# Character checks that check_field_contents runs together in one pass
+_FIELD_CONTENT_CHECKS = frozenset({'unicode', 'ampersand', 'special', 'accents'})
+
+# Person roles whose names are checked
+NAME_ROLES = ('author', 'editor')
+
+# Name fragments of common field-name typos and what was probably meant
+_TYPO_HINTS = (
+    ('journal', 'journal or journaltitle'),
+    ('title', 'title or journaltitle'),
+    ('addr', 'address or location'),
+    ('loc', 'address or location'),
+)
+
+# Values that mark a field as not yet filled in
+PLACEHOLDER_VALUES = frozenset({'tba', 'todo', '???', 'unknown', 'pending'})
+
+# Number of entries between progress lines in validate_all
+PROGRESS_INTERVAL = 100
+
+# Fields holding URLs or paths, where underscores are expected
+_URL_FIELDS = frozenset({'url', 'doi', 'eprint', 'file'})
+
+# Fraction of the shorter title's trigrams two titles must share before
+# find_duplicates compares them in full. Titles at 80% SequenceMatcher
+# similarity typically share well over a third of their trigrams, even
+# with edits scattered through the whole title.
+DUPLICATE_TRIGRAM_OVERLAP = 0.25
+
+# Precompiled patterns used by the per-entry checks
+_RE_DOI = re.compile(r'^10\.\d{4,}/\S+$')
+_RE_ISSN = re.compile(r'^\d{4}-\d{3}[\dX]$')
+# New-style (YYMM.NNNNN) and old-style (arch-ive/YYMMNNN) arXiv IDs in one pattern
+_RE_ARXIV = re.compile(r'^(?:\d{4}\.\d{4,5}|[a-z-]+/\d{7})$')
+_RE_PAGE_RANGE = re.compile(r'\d+[-–—]\d+')
+_RE_NAME_DIGIT = re.compile(r'\d')
+_RE_NAME_UNUSUAL = re.compile(r'[^\w\s,.\-\'`{}\\]')
+_RE_NAME_ACCENT = re.compile(r'\{\\[`\'^"~=.]\{?[a-zA-Z]\}?\}')
+_RE_NAME_COMMAND = re.compile(r'\{\\[a-zA-Z]+\{[a-zA-Z]\}\}')
+
+
+def has_unescaped(text: str, char: str) -> bool:
+    """Check if text contains char without a preceding backslash (e.g. '&' but not '\\&')."""
+    idx = text.find(char)
+    while idx != -1:
+        if idx == 0 or text[idx - 1] != '\\':
+            return True
+        idx = text.find(char, idx + 1)
+    return False
+
+
+@lru_cache(maxsize=256)
+def find_special_chars(text: str) -> frozenset:
+    """Return the problematic, accented and escape-needing characters present in text.
+
+    Both character checks scan the same field values back to back, so the
+    cache lets the second check reuse the first one's single pass.
+    """
+    if text.isascii():
+        # Most values are pure ASCII, where only the escape characters can
+        # occur; three substring searches beat walking every character
+        return frozenset(char for char in _ESCAPE_CHARS if char in text)
+    return _SPECIAL_CHARSET.intersection(text)
+
+
+def format_message(message) -> str:
+    """Format an issue/warning stored either as a string or as (template, *args)."""
+    if type(message) is str:
+        return message
+    return message[0].format(*message[1:])
+
+
+def parse_iso_date(date_str: str) -> Optional[Tuple[int, Optional[int]]]:
+    """Split a YYYY, YYYY-MM or YYYY-MM-DD date into (year, month); None if malformed."""
+    year, sep, rest = date_str.partition('-')
+    if len(year) != 4 or not year.isdecimal():
+        return None
+    if not sep:
+        return int(year), None
+
+    month, sep, day = rest.partition('-')
+    if len(month) != 2 or not month.isdecimal():
+        return None
+    if sep and (len(day) != 2 or not day.isdecimal()):
+        return None
+    return int(year), int(month)
+
+
+def title_trigrams(title: str) -> frozenset:
+    """Return the character 3-grams of a title, padded so short titles have some."""
+    padded = f"  {title} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@lru_cache(maxsize=1024)
+def unknown_field_hint(field_name: str) -> Optional[str]:
+    """Return None for a known field name, else the typo hint text for an unknown one.
+
+    The same handful of field names recurs in every entry, so results are cached.
+    """
+    field_lower = field_name.lower()
+    if field_lower in KNOWN_FIELDS:
+        return None
+
+    # Check if it's a close typo of a known field (first matching fragment wins)
+    for fragment, suggestion in _TYPO_HINTS:
+        if fragment in field_lower:
+            return f" (did you mean: {suggestion}?)"
+    return ""
+
+
+def missing_keys(value: str, all_keys: FrozenSet[str]) -> List[str]:
+    """Return the keys of a comma-separated key list that are not in all_keys, in order."""
+    keys = [k.strip() for k in value.split(',')]
+    # Resolved lists are the norm, and issuperset settles them in one C-level call
+    if all_keys.issuperset(keys):
+        return []
+    return [k for k in keys if k not in all_keys]
+
+
+def compile_field_specs(specs: list) -> Tuple[Tuple[FrozenSet[str], str], ...]:
+    """Turn field specs (names, or lists of alternatives) into (alternatives, display) pairs."""
+    compiled = []
+    for spec in specs:
+        if isinstance(spec, list):
+            # Single-item lists display as the bare field name
+            compiled.append((frozenset(spec), ' OR '.join(spec)))
+        else:
+            compiled.append((frozenset((spec,)), spec))
+    return tuple(compiled)
+
+
+# Precompiled required/recommended field specs, keyed by entry type
+_REQUIRED_SPECS = {
+    entry_type: compile_field_specs(spec.get('required', []))
+    for entry_type, spec in ENTRY_TYPES.items()
+}
+_RECOMMENDED_SPECS = {
+    entry_type: compile_field_specs(specs)
+    for entry_type, specs in RECOMMENDED_FIELDS.items()
+}
+
 
 class BibTeXCleaner:
     """Local formatting validator for BibTeX files."""
 
-    def __init__(self, verbose: bool = False):
+    __slots__ = ('verbose', 'use_cache', 'issues', 'warnings', 'removed_duplicates', '_person_strs')
+
+    def __init__(self, verbose: bool = False, use_cache: bool = False):
         """Initialize the cleaner."""
         self.verbose = verbose
+        self.use_cache = use_cache  # Reuse parse results while the .bib file is unchanged
+        # Messages are strings, or (template, *args) tuples from the hot
+        # per-field and per-name checks that are only formatted by format_message()
         self.issues = []
         self.warnings = []
         self.removed_duplicates = []  # Track removed duplicate fields
+        self._person_strs = {}  # id(person) -> (person, str(person))
 
     def log(self, message: str):
         """Print message if verbose mode is enabled."""
         if self.verbose:
             print(f"[INFO] {message}")
 
+    def _person_str(self, person) -> str:
+        """Return str(person), formatting each pybtex Person only once."""
+        cached = self._person_strs.get(id(person))
+        # Keeping the person alive in the cache guarantees its id is not reused
+        if cached is not None and cached[0] is person:
+            return cached[1]
+        person_str = str(person)
+        self._person_strs[id(person)] = (person, person_str)
+        return person_str
+
     def load_bibtex(self, filepath: str) -> BibliographyData:
         """Load a BibTeX file."""
         self.log(f"Loading BibTeX file: {filepath}")
 
         try:
-            bib_data = parse_file(filepath)
+            bib_data = self._load_cached(filepath) if self.use_cache else None
+            if bib_data is None:
+                bib_data = parse_file(filepath)
+                if self.use_cache:
+                    self._store_cached(filepath, bib_data)
             self.log(f"Loaded {len(bib_data.entries)} entries")
             return bib_data
         except Exception as e:
@@ -228,151 +456,213 @@ class BibTeXCleaner:
             print(f"{'='*60}")
             raise
 
+    def _cache_path(self, filepath: str) -> str:
+        """Return the parse-cache file used for filepath."""
+        digest = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+        return os.path.join(CACHE_DIR, f"{digest}.pickle")
+
+    def _load_cached(self, filepath: str) -> Optional[BibliographyData]:
+        """Return the cached parse of filepath if the file is unchanged, else None."""
+        stat = os.stat(filepath)
+        try:
+            with open(self._cache_path(filepath), 'rb') as f:
+                mtime_ns, size, bib_data = pickle.load(f)
+        except Exception:
+            # Missing, stale-format or corrupt cache - just parse again
+            return None
+
+        if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        self.log("Using cached parse result")
+        return bib_data
+
+    def _store_cached(self, filepath: str, bib_data: BibliographyData):
+        """Cache the parse of filepath, keyed by its modification time and size."""
+        stat = os.stat(filepath)
+        cache_path = self._cache_path(filepath)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((stat.st_mtime_ns, stat.st_size, bib_data), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic, so a concurrent run never sees a half-written cache
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.log(f"Could not write parse cache: {e}")
+
     def save_bibtex(self, bib_data: BibliographyData, filepath: str):
-        """Save BibTeX database to file."""
-        writer = Writer()
-        writer.write_file(bib_data, filepath)
+        """
+        Save BibTeX database to file.
+        Field values are written exactly as stored (pybtex's Writer would re-encode
+        them as LaTeX, turning an already escaped \\& into \\\\&).
+        """
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            if bib_data.preamble:
+                f.write(f"@preamble{{{bib_data.preamble}}}\n\n")
+
+            first = True
+            for key, entry in bib_data.entries.items():
+                if not first:
+                    f.write("\n")
+                first = False
+
+                # Persons first, then fields, as the pybtex writer orders them
+                parts = [f"@{entry.original_type}{{{key}"]
+                for role, persons in entry.persons.items():
+                    if persons:
+                        names = ' and '.join(self._person_str(person) for person in persons)
+                        parts.append(f",\n    {role} = {{{names}}}")
+                for field, value in entry.fields.items():
+                    parts.append(f",\n    {field} = {{{value}}}")
+                parts.append("\n}\n")
+                f.write(''.join(parts))
+
         self.log(f"Saved to: {filepath}")
 
     # ===== Character and Formatting Checks =====
 
-    def check_unicode_issues(self, key: str, entry: Entry):
-        """Check for problematic unicode characters."""
-        problematic_chars = {
-            '—': 'em-dash (use ---)',
-            '–': 'en-dash (use --)',
-            ''': 'smart quote (use \')',
-            ''': 'smart quote (use \')',
-            '"': 'smart quote (use ``)',
-            '"': 'smart quote (use \'\')',
-            '…': 'ellipsis (use ...)',
-        }
+    def _scan_unicode(self, key: str, field: str, value_str: str, issues: list):
+        """Record problematic unicode characters in one field value."""
+        found = find_special_chars(value_str) & _PROBLEMATIC_CHARSET
+        if not found:
+            return
 
-        for field, value in entry.fields.items():
-            value_str = str(value)
+        for char in sorted(found, key=_SPECIAL_CHAR_ORDER.__getitem__):
+            issues.append((_MSG_UNICODE, key, field, PROBLEMATIC_CHARS[char], char))
 
-            # Remove LaTeX accent commands to avoid false positives
-            # This prevents flagging things like {\"a} or {\'e} as smart quotes
-            cleaned_value = value_str
-            # Remove common LaTeX accent patterns: {\cmd{char}}, {\cmd char}, \cmd{char}, \cmd char
-            cleaned_value = re.sub(r'\{\\[`\'^"~=.uvHckr]\{?[a-zA-Z]\}?\}', '', cleaned_value)
-            cleaned_value = re.sub(r'\\[`\'^"~=.uvHckr]\{?[a-zA-Z]\}?', '', cleaned_value)
+    def _scan_ampersand(self, key: str, field: str, value_str: str, issues: list):
+        """Record an unescaped ampersand in one field value."""
+        if has_unescaped(value_str, '&'):
+            issues.append((_MSG_AMPERSAND, key, field))
 
-            for char, desc in problematic_chars.items():
-                if char in cleaned_value:
-                    self.issues.append(
-                        f"Entry {key}, field '{field}': Contains {desc} ('{char}')"
-                    )
+    def _scan_special(self, key: str, field: str, value_str: str, issues: list):
+        """Record unescaped underscores and percent signs in one field value."""
+        # Check for unescaped underscores (except in URLs)
+        if field not in _URL_FIELDS and has_unescaped(value_str, '_'):
+            issues.append((_MSG_UNDERSCORE, key, field))
+
+        # Check for unescaped percent signs
+        if has_unescaped(value_str, '%'):
+            issues.append((_MSG_PERCENT, key, field))
+
+    def _scan_accents(self, key: str, field: str, value_str: str, issues: list):
+        """Record unescaped accented characters in one field value."""
+        found = find_special_chars(value_str) & _ACCENT_CHARSET
+        if not found:
+            return
+
+        found_chars = [
+            f"{char} (should be {ACCENT_CHARS[char]})"
+            for char in sorted(found, key=_SPECIAL_CHAR_ORDER.__getitem__)
+        ]
+        issues.append((_MSG_ACCENTS, key, field, ", ".join(found_chars)))
+
+    def check_unicode_issues(self, key: str, entry: Entry):
+        """Check for problematic unicode characters."""
+        for field, value in entry.fields.items():
+            self._scan_unicode(key, field, value if type(value) is str else str(value), self.issues)
 
     def check_unescaped_ampersand(self, key: str, entry: Entry):
         """Check for unescaped ampersands."""
         for field, value in entry.fields.items():
-            value_str = str(value)
-            if re.search(r'(?<!\\)&', value_str):
-                self.issues.append(
-                    f"Entry {key}, field '{field}': Contains unescaped ampersand (use \\&)"
-                )
+            self._scan_ampersand(key, field, value if type(value) is str else str(value), self.issues)
 
     def check_special_characters(self, key: str, entry: Entry):
         """Check for improperly formatted special characters."""
         for field, value in entry.fields.items():
-            value_str = str(value)
-
-            # Check for unescaped underscores (except in URLs)
-            if '_' in value_str and field not in ['url', 'doi', 'eprint', 'file']:
-                if re.search(r'(?<!\\)_', value_str):
-                    self.issues.append(
-                        f"Entry {key}, field '{field}': May contain unescaped underscore (use \\_)"
-                    )
-
-            # Check for unescaped percent signs
-            if re.search(r'(?<!\\)%', value_str):
-                self.issues.append(
-                    f"Entry {key}, field '{field}': Contains unescaped percent sign (use \\%)"
-                )
+            self._scan_special(key, field, value if type(value) is str else str(value), self.issues)
 
     def check_accent_formatting(self, key: str, entry: Entry):
         """Check for unescaped accented characters."""
-        accent_chars = {
-            'á': r"\'a", 'à': r"\`a", 'ä': r'\"a', 'â': r"\^a", 'ã': r"\~a",
-            'Á': r"\'A", 'À': r"\`A", 'Ä': r'\"A', 'Â': r"\^A", 'Ã': r"\~A",
-            'é': r"\'e", 'è': r"\`e", 'ë': r'\"e', 'ê': r"\^e",
-            'É': r"\'E", 'È': r"\`E", 'Ë': r'\"E', 'Ê': r"\^E",
-            'í': r"\'i", 'ì': r"\`i", 'ï': r'\"i', 'î': r"\^i",
-            'Í': r"\'I", 'Ì': r"\`I", 'Ï': r'\"I', 'Î': r"\^I",
-            'ó': r"\'o", 'ò': r"\`o", 'ö': r'\"o', 'ô': r"\^o", 'õ': r"\~o",
-            'Ó': r"\'O", 'Ò': r"\`O", 'Ö': r'\"O', 'Ô': r"\^O", 'Õ': r"\~O",
-            'ú': r"\'u", 'ù': r"\`u", 'ü': r'\"u', 'û': r"\^u",
-            'Ú': r"\'U", 'Ù': r"\`U", 'Ü': r'\"U', 'Û': r"\^U",
-            'ñ': r"\~n", 'Ñ': r"\~N",
-            'ç': r"\c{c}", 'Ç': r"\c{C}",
-            'ß': r"\ss",
-        }
-
         for field, value in entry.fields.items():
-            value_str = str(value)
-            found_chars = []
+            self._scan_accents(key, field, value if type(value) is str else str(value), self.issues)
 
-            for char, latex_form in accent_chars.items():
-                if char in value_str:
-                    found_chars.append(f"{char} (should be {latex_form})")
+    def check_field_contents(self, key: str, entry: Entry):
+        """Run the unicode, ampersand, special-character and accent checks in one pass."""
+        unicode_issues = []
+        ampersand_issues = []
+        special_issues = []
+        accent_issues = []
 
-            if found_chars:
-                chars_str = ", ".join(found_chars)
-                self.issues.append(
-                    f"Entry {key}, field '{field}': Unescaped accents: {chars_str}"
-                )
+        for field, value in entry.fields.items():
+            # pybtex field values are almost always plain str already
+            value_str = value if type(value) is str else str(value)
+
+            # One set intersection classifies the value; most fields contain
+            # none of the flagged characters and need no further work
+            found = find_special_chars(value_str)
+            if not found:
+                continue
+
+            # Only run the scanners whose characters actually occur
+            if not found.isdisjoint(_PROBLEMATIC_CHARSET):
+                self._scan_unicode(key, field, value_str, unicode_issues)
+            if '&' in found:
+                self._scan_ampersand(key, field, value_str, ampersand_issues)
+            if '_' in found or '%' in found:
+                self._scan_special(key, field, value_str, special_issues)
+            if not found.isdisjoint(_ACCENT_CHARSET):
+                self._scan_accents(key, field, value_str, accent_issues)
+
+        # Report in the same order as running the four checks one after another
+        self.issues.extend(unicode_issues)
+        self.issues.extend(ampersand_issues)
+        self.issues.extend(special_issues)
+        self.issues.extend(accent_issues)
 
     def check_name_formatting(self, key: str, entry: Entry):
         """Check for name formatting issues."""
-        for role in ['author', 'editor']:
-            if role in entry.persons:
-                persons = entry.persons[role]
+        for role in NAME_ROLES:
+            persons = entry.persons.get(role)
+            if not persons:
+                continue
 
-                # Check for "and others" with too few authors (likely hallucination)
-                # Count real authors (excluding "others")
-                real_author_count = sum(1 for p in persons if str(p).lower() != 'others')
-                has_others = any(str(p).lower() == 'others' for p in persons)
+            person_strs = [self._person_str(p) for p in persons]
+            # "others" is valid in BibTeX/BibLaTeX for "et al."
+            is_others = [p.lower() == 'others' for p in person_strs]
 
-                if has_others and real_author_count < 5:
-                    self.warnings.append(
-                        f"Entry {key}: Found 'and others' with only {real_author_count} real {role}(s) - possible hallucination"
-                    )
+            # Check for "and others" with too few authors (likely hallucination)
+            # Count real authors (excluding "others")
+            real_author_count = is_others.count(False)
+            has_others = real_author_count < len(is_others)
+
+            if has_others and real_author_count < 5:
+                self.warnings.append(
+                    f"Entry {key}: Found 'and others' with only {real_author_count} real {role}(s) - possible hallucination"
+                )
+
+            for idx, (person_str, others) in enumerate(zip(person_strs, is_others), 1):
+
+                # Single-word names (potential parsing issue)
+                stripped = person_str.strip()
+                if ' ' not in stripped and ',' not in stripped and not others:
+                    self.warnings.append((_MSG_NAME_SINGLE_WORD, key, role, idx, person_str))
+
+                # Numbers in names
+                if _RE_NAME_DIGIT.search(person_str):
+                    self.issues.append((_MSG_NAME_DIGITS, key, role, idx, person_str))
 
-                for idx, person in enumerate(persons, 1):
-                    person_str = str(person)
-
-                    # Single-word names (potential parsing issue)
-                    # Exception: "others" is valid in BibTeX/BibLaTeX for "et al."
-                    if ' ' not in person_str.strip() and ',' not in person_str.strip():
-                        if person_str.lower() != 'others':
-                            self.warnings.append(
-                                f"Entry {key}, {role} #{idx} '{person_str}': Single-word name (check parsing)"
-                            )
-
-                    # Numbers in names
-                    if re.search(r'\d', person_str):
-                        self.issues.append(
-                            f"Entry {key}, {role} #{idx} '{person_str}': Contains numbers"
-                        )
-
-                    # Unusual characters (but allow LaTeX commands)
-                    # Remove LaTeX commands first: {\' ...}, {\^ ...}, {\` ...}, etc.
-                    cleaned_name = re.sub(r'\{\\[`\'^"~=.]\{?[a-zA-Z]\}?\}', '', person_str)
-                    # Also remove other common LaTeX patterns
-                    cleaned_name = re.sub(r'\{\\[a-zA-Z]+\{[a-zA-Z]\}\}', '', cleaned_name)
-
-                    # Now check for unusual characters (allow LaTeX special chars: {}\)
-                    if re.search(r'[^\w\s,.\-\'`{}\\]', cleaned_name):
-                        self.warnings.append(
-                            f"Entry {key}, {role} #{idx} '{person_str}': Contains unusual characters"
-                        )
+                # Unusual characters (but allow LaTeX commands)
+                # Stripping only removes characters, so a clean name needs no stripping
+                if not _RE_NAME_UNUSUAL.search(person_str):
+                    continue
+
+                # Remove LaTeX commands first: {\' ...}, {\^ ...}, {\` ...}, etc.
+                cleaned_name = _RE_NAME_ACCENT.sub('', person_str)
+                # Also remove other common LaTeX patterns
+                cleaned_name = _RE_NAME_COMMAND.sub('', cleaned_name)
+
+                # Now check for unusual characters (allow LaTeX special chars: {}\)
+                if _RE_NAME_UNUSUAL.search(cleaned_name):
+                    self.warnings.append((_MSG_NAME_UNUSUAL, key, role, idx, person_str))
 
     # ===== Entry Type and Field Validation =====
 
-    def check_entry_type_fields(self, key: str, entry: Entry):
+    def check_entry_type_fields(self, key: str, entry: Entry, entry_type: Optional[str] = None):
         """Check required fields for entry type (accepts both BibTeX and BibLaTeX field names)."""
-        entry_type = entry.type.lower()
+        if entry_type is None:
+            entry_type = entry.type
 
         if entry_type not in ENTRY_TYPES:
             self.warnings.append(
@@ -380,22 +670,14 @@ class BibTeXCleaner:
             )
             return
 
-        spec = ENTRY_TYPES[entry_type]
-        required = spec.get('required', [])
+        # Fields can be strings (exact match) or lists (any alternative is acceptable);
+        # both are precompiled into (alternatives, display) pairs
+        present = {name.lower() for name in entry.fields}
+        present.update(role.lower() for role in entry.persons)
 
         # Check for missing required fields
-        # Fields can be strings (exact match) or lists (any alternative is acceptable)
-        missing = []
-        for field_spec in required:
-            if isinstance(field_spec, list):
-                # Alternative fields - at least one must be present
-                alternatives = field_spec
-                if not any(alt in entry.fields or alt in entry.persons for alt in alternatives):
-                    missing.append(' OR '.join(alternatives))
-            else:
-                # Single required field
-                if field_spec not in entry.fields and field_spec not in entry.persons:
-                    missing.append(field_spec)
+        missing = [display for alternatives, display in _REQUIRED_SPECS[entry_type]
+                   if alternatives.isdisjoint(present)]
 
         if missing:
             self.issues.append(
@@ -405,29 +687,22 @@ class BibTeXCleaner:
     def check_unknown_fields(self, key: str, entry: Entry):
         """Check for unknown/forbidden field names (likely typos)."""
         for field_name in entry.fields.keys():
-            if field_name.lower() not in KNOWN_FIELDS:
-                # Check if it's a close typo of a known field
-                suggestions = []
-                field_lower = field_name.lower()
-
-                # Check for common typos
-                if 'journal' in field_lower:
-                    suggestions.append('journal or journaltitle')
-                elif 'title' in field_lower:
-                    suggestions.append('title or journaltitle')
-                elif 'addr' in field_lower or 'loc' in field_lower:
-                    suggestions.append('address or location')
-
-                suggestion_text = f" (did you mean: {', '.join(suggestions)}?)" if suggestions else ""
+            # Field names are nearly always lowercase already
+            if field_name in KNOWN_FIELDS:
+                continue
+            suggestion_text = unknown_field_hint(field_name)
+            if suggestion_text is not None:
                 self.issues.append(
                     f"Entry {key}: Unknown field '{field_name}'{suggestion_text}"
                 )
 
     def check_date_validity(self, key: str, entry: Entry):
         """Check date and year validity."""
+        fields = entry.fields
+
         # Check year
-        if 'year' in entry.fields:
-            year_str = entry.fields['year']
+        year_str = fields.get('year')
+        if year_str is not None:
             try:
                 year = int(year_str)
                 current_year = datetime.now().year
@@ -440,42 +715,31 @@ class BibTeXCleaner:
                 self.issues.append(f"Entry {key}: Invalid year format '{year_str}'")
 
         # Check date field
-        if 'date' in entry.fields:
-            date_str = entry.fields['date']
+        date_str = fields.get('date')
+        if date_str is not None:
 
             # Check for valid date formats: YYYY, YYYY-MM, or YYYY-MM-DD
-            if re.match(r'^\d{4}$', date_str):
-                # Year only - valid, check range
-                try:
-                    year = int(date_str)
-                    current_year = datetime.now().year
-                    if year < 1000:
-                        self.issues.append(f"Entry {key}: Year '{year}' in date field seems too old")
-                    elif year > current_year + 5:
-                        self.issues.append(f"Entry {key}: Future year '{year}' in date field (>5 years ahead)")
-                except ValueError:
-                    pass
-            elif re.match(r'^\d{4}-\d{2}$', date_str):
-                # Year-month - valid, check month validity
-                month_match = re.match(r'^\d{4}-(\d{2})$', date_str)
-                if month_match:
-                    month = int(month_match.group(1))
-                    if month < 1 or month > 12:
-                        self.issues.append(f"Entry {key}: Invalid month '{month}' in date")
-            elif re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-                # Full ISO date - valid, check month validity
-                month_match = re.match(r'^\d{4}-(\d{2})-\d{2}$', date_str)
-                if month_match:
-                    month = int(month_match.group(1))
-                    if month < 1 or month > 12:
-                        self.issues.append(f"Entry {key}: Invalid month '{month}' in date")
-            else:
+            parsed = parse_iso_date(date_str)
+            if parsed is None:
                 # Invalid format
                 self.warnings.append(f"Entry {key}: Date '{date_str}' not in valid format (use YYYY, YYYY-MM, or YYYY-MM-DD)")
+            elif parsed[1] is None:
+                # Year only - valid, check range
+                year = parsed[0]
+                current_year = datetime.now().year
+                if year < 1000:
+                    self.issues.append(f"Entry {key}: Year '{year}' in date field seems too old")
+                elif year > current_year + 5:
+                    self.issues.append(f"Entry {key}: Future year '{year}' in date field (>5 years ahead)")
+            else:
+                # Year-month or full ISO date - valid, check month validity
+                month = parsed[1]
+                if month < 1 or month > 12:
+                    self.issues.append(f"Entry {key}: Invalid month '{month}' in date")
 
         # Check month field
-        if 'month' in entry.fields:
-            month_str = entry.fields['month']
+        month_str = fields.get('month')
+        if month_str is not None:
             try:
                 month = int(month_str)
                 if month < 1 or month > 12:
@@ -485,40 +749,41 @@ class BibTeXCleaner:
 
     def check_identifier_formats(self, key: str, entry: Entry):
         """Check ISBN, ISSN, arXiv, DOI formats."""
+        fields = entry.fields
+
         # Check DOI
-        if 'doi' in entry.fields:
-            doi = entry.fields['doi']
+        doi = fields.get('doi')
+        if doi is not None:
             # Check for placeholder values
-            if doi.lower() in ['tba', 'todo', '???', 'unknown', 'pending']:
+            if doi.lower() in PLACEHOLDER_VALUES:
                 self.issues.append(f"Entry {key}: Placeholder value in doi: '{doi}'")
             # Check DOI format
-            elif not re.match(r'^10\.\d{4,}/\S+$', doi):
+            elif not _RE_DOI.match(doi):
                 self.issues.append(f"Entry {key}: Invalid DOI format '{doi}'")
 
         # Check ISBN
-        if 'isbn' in entry.fields:
-            isbn = entry.fields['isbn'].replace('-', '').replace(' ', '')
-            if len(isbn) not in [10, 13]:
-                self.issues.append(f"Entry {key}: Invalid ISBN length '{entry.fields['isbn']}'")
+        raw_isbn = fields.get('isbn')
+        if raw_isbn is not None:
+            isbn = raw_isbn.replace('-', '').replace(' ', '')
+            if len(isbn) not in (10, 13):
+                self.issues.append(f"Entry {key}: Invalid ISBN length '{raw_isbn}'")
 
         # Check ISSN
-        if 'issn' in entry.fields:
-            issn = entry.fields['issn']
-            if not re.match(r'^\d{4}-\d{3}[\dX]$', issn):
-                self.issues.append(f"Entry {key}: Invalid ISSN format '{issn}' (should be XXXX-XXXX)")
+        issn = fields.get('issn')
+        if issn is not None and not _RE_ISSN.match(issn):
+            self.issues.append(f"Entry {key}: Invalid ISSN format '{issn}' (should be XXXX-XXXX)")
 
         # Check arXiv
-        if 'eprint' in entry.fields and entry.fields.get('eprinttype') == 'arxiv':
-            arxiv = entry.fields['eprint']
+        arxiv = fields.get('eprint')
+        if arxiv is not None and fields.get('eprinttype') == 'arxiv':
             # New format: YYMM.NNNNN or old format: arch-ive/YYMMNNN
-            if not re.match(r'^\d{4}\.\d{4,5}$', arxiv) and not re.match(r'^[a-z-]+/\d{7}$', arxiv):
+            if not _RE_ARXIV.match(arxiv):
                 self.issues.append(f"Entry {key}: Invalid arXiv ID format '{arxiv}'")
 
         # Check for placeholder values in URL
-        if 'url' in entry.fields:
-            url = entry.fields['url']
-            if url.lower() in ['tba', 'todo', '???', 'unknown', 'pending']:
-                self.issues.append(f"Entry {key}: Placeholder value in url: '{url}'")
+        url = fields.get('url')
+        if url is not None and url.lower() in PLACEHOLDER_VALUES:
+            self.issues.append(f"Entry {key}: Placeholder value in url: '{url}'")
 
     def check_page_format(self, key: str, entry: Entry):
         """
@@ -526,11 +791,10 @@ class BibTeXCleaner:
         Single page numbers (e.g., '077401') are fine.
         Page ranges should use double hyphen (e.g., '123--456' not '123-456').
         """
-        if 'pages' not in entry.fields:
+        pages = entry.fields.get('pages')
+        if pages is None:
             return
 
-        pages = entry.fields['pages']
-
         # If already has double hyphen, it's correct
         if '--' in pages:
             return
@@ -544,7 +808,7 @@ class BibTeXCleaner:
         if '-' in pages or '–' in pages or '—' in pages:
             # This looks like a page range with single hyphen
             # Check if it's actually a range (has digits on both sides of the hyphen)
-            if re.search(r'\d+[-–—]\d+', pages):
+            if _RE_PAGE_RANGE.search(pages):
                 # This is a page range with single hyphen/dash
                 self.warnings.append(
                     f"Entry {key}: Page range uses single hyphen/dash. Use double hyphen '--' instead: '{pages}'"
@@ -553,65 +817,36 @@ class BibTeXCleaner:
 
     def check_field_consistency(self, key: str, entry: Entry):
         """Check field naming consistency (BibTeX vs BibLaTeX)."""
-        # Check if entry mixes BibTeX and BibLaTeX field names
-        has_bibtex_fields = False
-        has_biblatex_fields = False
-        mixed_fields = []
-
-        # Check for BibTeX-style fields
-        if 'journal' in entry.fields:
-            has_bibtex_fields = True
-        if 'year' in entry.fields and 'date' not in entry.fields:
-            has_bibtex_fields = True
-        if 'address' in entry.fields:
-            has_bibtex_fields = True
-
-        # Check for BibLaTeX-style fields
-        if 'journaltitle' in entry.fields:
-            has_biblatex_fields = True
-        if 'date' in entry.fields:
-            has_biblatex_fields = True
-        if 'location' in entry.fields:
-            has_biblatex_fields = True
+        fields = entry.fields
 
         # Warn if both present (especially problematic pairs)
-        if 'journal' in entry.fields and 'journaltitle' in entry.fields:
+        if 'journal' in fields and 'journaltitle' in fields:
             self.warnings.append(
                 f"Entry {key}: Has both 'journal' (BibTeX) and 'journaltitle' (BibLaTeX) - use only one"
             )
 
-        if 'year' in entry.fields and 'date' in entry.fields:
+        if 'year' in fields and 'date' in fields:
             self.warnings.append(
                 f"Entry {key}: Has both 'year' (BibTeX) and 'date' (BibLaTeX) - use only one"
             )
 
-        if 'address' in entry.fields and 'location' in entry.fields:
+        if 'address' in fields and 'location' in fields:
             self.warnings.append(
                 f"Entry {key}: Has both 'address' (BibTeX) and 'location' (BibLaTeX) - use only one"
             )
 
-    def check_completeness(self, key: str, entry: Entry):
+    def check_completeness(self, key: str, entry: Entry, entry_type: Optional[str] = None):
         """Check for recommended fields (accepts both BibTeX and BibLaTeX alternatives)."""
-        entry_type = entry.type.lower()
-
-        if entry_type in RECOMMENDED_FIELDS:
-            recommended = RECOMMENDED_FIELDS[entry_type]
-            missing = []
-
-            for field_spec in recommended:
-                if isinstance(field_spec, list):
-                    # Alternative fields - at least one must be present
-                    alternatives = field_spec
-                    if not any(alt in entry.fields for alt in alternatives):
-                        # Don't show "OR" for single-item lists
-                        if len(alternatives) == 1:
-                            missing.append(alternatives[0])
-                        else:
-                            missing.append(' OR '.join(alternatives))
-                else:
-                    # Single recommended field
-                    if field_spec not in entry.fields:
-                        missing.append(field_spec)
+        if entry_type is None:
+            entry_type = entry.type
+
+        recommended = _RECOMMENDED_SPECS.get(entry_type)
+        if recommended is not None:
+            present = {name.lower() for name in entry.fields}
+
+            # Alternative fields - at least one must be present
+            missing = [display for alternatives, display in recommended
+                       if alternatives.isdisjoint(present)]
 
             if missing:
                 self.warnings.append(
@@ -625,38 +860,36 @@ class BibTeXCleaner:
                 f"Entry {key}: Suspiciously bare entry (only {total_fields} fields)"
             )
 
-    def check_crossrefs(self, bib_data: BibliographyData):
+    def check_crossrefs(self, bib_data: BibliographyData, all_keys: Optional[FrozenSet[str]] = None):
         """Check crossref/xdata/related validity."""
-        all_keys = set(bib_data.entries.keys())
+        if all_keys is None:
+            all_keys = frozenset(bib_data.entries.keys())
 
         for key, entry in bib_data.entries.items():
+            fields = entry.fields
+
             # Check crossref
-            if 'crossref' in entry.fields:
-                ref_key = entry.fields['crossref']
-                if ref_key not in all_keys:
-                    self.issues.append(
-                        f"Entry {key}: Broken crossref to '{ref_key}' (entry does not exist)"
-                    )
+            ref_key = fields.get('crossref')
+            if ref_key is not None and ref_key not in all_keys:
+                self.issues.append(
+                    f"Entry {key}: Broken crossref to '{ref_key}' (entry does not exist)"
+                )
 
             # Check xdata
-            if 'xdata' in entry.fields:
-                xdata_keys = entry.fields['xdata'].split(',')
-                for xdata_key in xdata_keys:
-                    xdata_key = xdata_key.strip()
-                    if xdata_key not in all_keys:
-                        self.issues.append(
-                            f"Entry {key}: Broken xdata to '{xdata_key}' (entry does not exist)"
-                        )
+            xdata = fields.get('xdata')
+            if xdata is not None:
+                for xdata_key in missing_keys(xdata, all_keys):
+                    self.issues.append(
+                        f"Entry {key}: Broken xdata to '{xdata_key}' (entry does not exist)"
+                    )
 
             # Check related
-            if 'related' in entry.fields:
-                related_keys = entry.fields['related'].split(',')
-                for rel_key in related_keys:
-                    rel_key = rel_key.strip()
-                    if rel_key not in all_keys:
-                        self.warnings.append(
-                            f"Entry {key}: Broken related to '{rel_key}' (entry does not exist)"
-                        )
+            related = fields.get('related')
+            if related is not None:
+                for rel_key in missing_keys(related, all_keys):
+                    self.warnings.append(
+                        f"Entry {key}: Broken related to '{rel_key}' (entry does not exist)"
+                    )
 
     def remove_duplicate_fields(self, bib_data: BibliographyData) -> List[str]:
         """
@@ -669,51 +902,81 @@ class BibTeXCleaner:
         removed_duplicates = []
 
         for key, entry in bib_data.entries.items():
-            # Check for journal AND journaltitle - keep journaltitle
-            if 'journal' in entry.fields and 'journaltitle' in entry.fields:
-                journal_value = entry.fields['journal']
-                journaltitle_value = entry.fields['journaltitle']
-                del entry.fields['journal']
-                removed_duplicates.append(
-                    f"Entry {key}: Removed duplicate 'journal' field (kept 'journaltitle')"
-                )
-
-            # Check for year AND date - keep date
-            if 'year' in entry.fields and 'date' in entry.fields:
-                year_value = entry.fields['year']
-                date_value = entry.fields['date']
-                del entry.fields['year']
-                removed_duplicates.append(
-                    f"Entry {key}: Removed duplicate 'year' field (kept 'date')"
-                )
+            # One pass over the field names finds every field involved in a pair
+            present = _DUPLICATE_FIELDS.intersection(map(str.lower, entry.fields))
+            if len(present) < 2:
+                continue
+
+            # Check for journal AND journaltitle / year AND date - keep the BibLaTeX one
+            for dropped, kept in _DUPLICATE_FIELD_PAIRS:
+                if dropped in present and kept in present:
+                    del entry.fields[dropped]
+                    removed_duplicates.append(
+                        f"Entry {key}: Removed duplicate '{dropped}' field (kept '{kept}')"
+                    )
 
         return removed_duplicates
 
     def find_duplicates(self, bib_data: BibliographyData, threshold: float = 0.8) -> List[Tuple[str, str, float]]:
         """Find potential duplicate entries."""
-        duplicates = []
-        entries_list = list(bib_data.entries.items())
+        from difflib import SequenceMatcher
 
-        for i, (key1, entry1) in enumerate(entries_list):
-            for key2, entry2 in entries_list[i + 1:]:
-                # Compare titles
-                title1 = entry1.fields.get('title', '').lower()
-                title2 = entry2.fields.get('title', '').lower()
+        # Lowercase titles and collect authors once per entry rather than per pair
+        keys, titles, authors, trigrams = [], [], [], []
+        for key, entry in bib_data.entries.items():
+            title = entry.fields.get('title', '').lower()
+            if not title:
+                continue
+            keys.append(key)
+            titles.append(title)
+            authors.append(frozenset(self._person_str(p) for p in entry.persons.get('author', [])))
+            trigrams.append(title_trigrams(title))
+
+        # Block candidate pairs with an inverted trigram index built as we go:
+        # each title is only compared with earlier titles sharing enough trigrams
+        matches = []
+        index: Dict[str, List[int]] = {}
+        matcher = SequenceMatcher(None)
+        for j, grams in enumerate(trigrams):
+            shared = Counter()
+            for gram in grams:
+                postings = index.get(gram)
+                if postings is None:
+                    index[gram] = [j]
+                else:
+                    shared.update(postings)
+                    postings.append(j)
 
-                if not title1 or not title2:
+            # The later title stays as seq2, so its index is built once for all candidates
+            matcher.set_seq2(titles[j])
+            for i, count in shared.items():
+                if count < DUPLICATE_TRIGRAM_OVERLAP * min(len(trigrams[i]), len(grams)):
                     continue
 
-                # Calculate similarity
-                similarity = SequenceMatcher(None, title1, title2).ratio()
+                if titles[i] == titles[j]:
+                    # Exact duplicates (after lowercasing) need no matching at all
+                    similarity = 1.0
+                else:
+                    # Cheap upper bounds first; ratio() only for pairs that could pass
+                    matcher.set_seq1(titles[i])
+                    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                        continue
+
+                    # Calculate similarity
+                    similarity = matcher.ratio()
 
                 if similarity >= threshold:
                     # Check authors too
-                    authors1 = set(str(p) for p in entry1.persons.get('author', []))
-                    authors2 = set(str(p) for p in entry2.persons.get('author', []))
+                    authors1 = authors[i]
+                    authors2 = authors[j]
 
                     # If titles are very similar, it's likely a duplicate
                     if similarity >= 0.9 or (authors1 and authors2 and authors1 == authors2):
-                        duplicates.append((key1, key2, similarity))
+                        matches.append((i, j, similarity))
+
+        # Keep the original pairwise order in the output
+        matches.sort()
+        duplicates = [(keys[i], keys[j], similarity) for i, j, similarity in matches]
 
         for key1, key2, sim in duplicates:
             self.warnings.append(
@@ -724,6 +987,39 @@ class BibTeXCleaner:
 
     # ===== Main Validation =====
 
+    def check_entry(self, key: str, entry: Entry, checks: FrozenSet[str] = ENTRY_CHECKS):
+        """Run the per-entry checks named in checks (see ENTRY_CHECKS) on one entry."""
+        # pybtex lowercases Entry.type on construction (original_type keeps the
+        # source spelling); interning makes type-table lookups hit by identity
+        entry_type = sys.intern(entry.type)
+
+        if _FIELD_CONTENT_CHECKS <= checks:
+            self.check_field_contents(key, entry)
+        else:
+            if 'unicode' in checks:
+                self.check_unicode_issues(key, entry)
+            if 'ampersand' in checks:
+                self.check_unescaped_ampersand(key, entry)
+            if 'special' in checks:
+                self.check_special_characters(key, entry)
+            if 'accents' in checks:
+                self.check_accent_formatting(key, entry)
+        if 'names' in checks:
+            self.check_name_formatting(key, entry)
+        if 'entry_types' in checks:
+            self.check_entry_type_fields(key, entry, entry_type)
+        if 'unknown_fields' in checks:
+            self.check_unknown_fields(key, entry)
+        if 'dates' in checks:
+            self.check_date_validity(key, entry)
+        if 'identifiers' in checks:
+            self.check_identifier_formats(key, entry)
+            self.check_page_format(key, entry)
+        if 'consistency' in checks:
+            self.check_field_consistency(key, entry)
+        if 'completeness' in checks:
+            self.check_completeness(key, entry, entry_type)
+
     def validate_all(self, bib_data: BibliographyData,
                      check_unicode: bool = True,
                      check_ampersand: bool = True,
@@ -737,80 +1033,126 @@ class BibTeXCleaner:
                      check_consistency: bool = True,
                      check_completeness: bool = True,
                      check_crossrefs_flag: bool = True,
-                     check_duplicates: bool = True):
-        """Run all validation checks."""
+                     check_duplicates: bool = True,
+                     jobs: int = 1):
+        """Run all validation checks (per-entry checks in `jobs` processes if > 1)."""
         total = len(bib_data.entries)
         print(f"\nValidating {total} entries (local checks only, no API calls)...")
         print("=" * 60)
 
+        # Person objects are formatted at most once per run
+        self._person_strs = {}
+
         # Remove duplicate fields (journal/journaltitle, year/date) automatically
         self.removed_duplicates = self.remove_duplicate_fields(bib_data)
         if self.removed_duplicates:
             print(f"\nAutomatically removed {len(self.removed_duplicates)} duplicate field(s)")
-            for msg in self.removed_duplicates:
-                print(f"  ✓ {msg}")
+            # One write for the whole list rather than one per field
+            print('\n'.join(f"  ✓ {msg}" for msg in self.removed_duplicates))
+
+        # Entry keys, built once for the database-wide checks
+        all_keys = frozenset(bib_data.entries.keys())
+
+        # Names of the enabled per-entry checks, resolved once for the whole run
+        flags = {
+            'unicode': check_unicode,
+            'ampersand': check_ampersand,
+            'special': check_special,
+            'accents': check_accents,
+            'names': check_names,
+            'entry_types': check_entry_types,
+            'unknown_fields': check_unknown_fields,
+            'dates': check_dates,
+            'identifiers': check_identifiers,
+            'consistency': check_consistency,
+            'completeness': check_completeness,
+        }
+        checks = frozenset(name for name, enabled in flags.items() if enabled)
 
         # Per-entry checks
-        for idx, (key, entry) in enumerate(bib_data.entries.items(), 1):
-            print(f"\n[{idx}/{total}] Checking: {key}")
+        if jobs > 1 and total > 1:
+            self._check_entries_parallel(list(bib_data.entries.items()), checks, jobs)
+        else:
+            for idx, (key, entry) in enumerate(bib_data.entries.items(), 1):
+                self.log(f"[{idx}/{total}] Checking: {key}")
+                if idx % PROGRESS_INTERVAL == 0 or idx == total:
+                    print(f"  Checked {idx}/{total} entries")
 
-            if check_unicode:
-                self.check_unicode_issues(key, entry)
-            if check_ampersand:
-                self.check_unescaped_ampersand(key, entry)
-            if check_special:
-                self.check_special_characters(key, entry)
-            if check_accents:
-                self.check_accent_formatting(key, entry)
-            if check_names:
-                self.check_name_formatting(key, entry)
-            if check_entry_types:
-                self.check_entry_type_fields(key, entry)
-            if check_unknown_fields:
-                self.check_unknown_fields(key, entry)
-            if check_dates:
-                self.check_date_validity(key, entry)
-            if check_identifiers:
-                self.check_identifier_formats(key, entry)
-                self.check_page_format(key, entry)
-            if check_consistency:
-                self.check_field_consistency(key, entry)
-            if check_completeness:
-                self.check_completeness(key, entry)
+                self.check_entry(key, entry, checks)
 
         # Database-wide checks
         if check_crossrefs_flag:
-            self.check_crossrefs(bib_data)
+            self.check_crossrefs(bib_data, all_keys)
         if check_duplicates:
             self.find_duplicates(bib_data)
 
-    def generate_report(self) -> str:
-        """Generate validation report."""
-        report = []
-        report.append("\n" + "=" * 60)
-        report.append("BIBTEX FORMATTING REPORT")
-        report.append("=" * 60)
+    def _check_entries_parallel(self, items: List[Tuple[str, Entry]],
+                                checks: FrozenSet[str], jobs: int):
+        """Run check_entry over items in worker processes, merging results in entry order."""
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+
+        total = len(items)
+        # A few chunks per worker keeps the pool busy without pickling per entry
+        chunk_size = -(-total // (jobs * 4))
+        chunks = [items[i:i + chunk_size] for i in range(0, total, chunk_size)]
+
+        done = 0
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # map() yields in submission order, so the report matches a serial run
+            results = pool.map(check_entries_chunk, chunks, repeat(checks))
+            for chunk, (issues, warnings) in zip(chunks, results):
+                self.issues.extend(issues)
+                self.warnings.extend(warnings)
+                done += len(chunk)
+                print(f"  Checked {done}/{total} entries")
+
+    def _report_lines(self):
+        """Yield the lines of the validation report."""
+        yield "\n" + "=" * 60
+        yield "BIBTEX FORMATTING REPORT"
+        yield "=" * 60
 
         if self.removed_duplicates:
-            report.append(f"\nDuplicate Fields Removed: {len(self.removed_duplicates)}")
+            yield f"\nDuplicate Fields Removed: {len(self.removed_duplicates)}"
             for msg in self.removed_duplicates:
-                report.append(f"  ✓ {msg}")
+                yield f"  ✓ {msg}"
 
         if self.issues:
-            report.append(f"\nIssues Found: {len(self.issues)}")
+            yield f"\nIssues Found: {len(self.issues)}"
             for issue in self.issues:
-                report.append(f"  ✗ {issue}")
+                yield f"  ✗ {format_message(issue)}"
 
         if self.warnings:
-            report.append(f"\nWarnings: {len(self.warnings)}")
+            yield f"\nWarnings: {len(self.warnings)}"
             for warning in self.warnings:
-                report.append(f"  ⚠ {warning}")
+                yield f"  ⚠ {format_message(warning)}"
 
         if not self.issues and not self.warnings and not self.removed_duplicates:
-            report.append("\n✓ No issues found!")
+            yield "\n✓ No issues found!"
+
+        yield "\n" + "=" * 60
+
+    def generate_report(self) -> str:
+        """Generate validation report."""
+        return "\n".join(self._report_lines())
+
+    def write_report(self, f):
+        """Stream the validation report to an open text file, line by line."""
+        lines = self._report_lines()
+        f.write(next(lines))
+        for line in lines:
+            f.write("\n")
+            f.write(line)
+
+
+def check_entries_chunk(items: List[Tuple[str, Entry]], checks: FrozenSet[str]) -> Tuple[list, list]:
+    """Run the per-entry checks on (key, entry) pairs; worker for validate_all(jobs > 1)."""
+    cleaner = BibTeXCleaner()
+    for key, entry in items:
+        cleaner.check_entry(key, entry, checks)
+    return cleaner.issues, cleaner.warnings
 
-        report.append("\n" + "=" * 60)
-        return "\n".join(report)
 
 
 def main():
@@ -835,6 +1177,10 @@ Examples:
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--fix', action='store_true',
                        help='Automatically fix issues and save to *_formatting_corrected.bib')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                       help='Run the per-entry checks in this many processes (default: 1)')
+    parser.add_argument('--cache', action='store_true',
+                       help='Cache the parsed file in ~/.cache/biblatex_check to speed up re-runs')
 
     # Diagnostic options
     parser.add_argument('--no-unicode', action='store_true', help='Skip unicode checking')
@@ -859,7 +1205,7 @@ Examples:
         args.report_file = clean_filepath(args.report_file)
 
     # Initialize cleaner
-    cleaner = BibTeXCleaner(verbose=args.verbose)
+    cleaner = BibTeXCleaner(verbose=args.verbose, use_cache=args.cache)
 
     try:
         # Load BibTeX file
@@ -880,7 +1226,8 @@ Examples:
             check_consistency=not args.no_consistency,
             check_completeness=not args.no_completeness,
             check_crossrefs_flag=not args.no_crossrefs,
-            check_duplicates=not args.no_duplicates
+            check_duplicates=not args.no_duplicates,
+            jobs=args.jobs
         )
 
         # Save corrected file if --fix option is used
@@ -892,14 +1239,14 @@ Examples:
             cleaner.save_bibtex(bib_data, output_file)
             print(f"\n✓ Corrected file saved to: {output_file}")
 
-        # Generate report
-        report = cleaner.generate_report()
+        # Write report
         if args.report_file:
             with open(args.report_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+                cleaner.write_report(f)
             print(f"\n✓ Report saved to: {args.report_file}")
         else:
-            print(report)
+            cleaner.write_report(sys.stdout)
+            sys.stdout.write("\n")
 
     except FileNotFoundError:
         print(f"Error: File '{args.input_file}' not found")
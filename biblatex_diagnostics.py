@@ -10,9 +10,17 @@ import os
 import time
 import random
 import argparse
+import hashlib
+import json
+import sqlite3
+import threading
 import requests
 import unicodedata
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from pybtex.database import parse_file, BibliographyData, Entry, Person
 from pybtex.database.output.bibtex import Writer
 
@@ -25,18 +33,88 @@ except ImportError:
     scholarly = None
     ProxyGenerator = None
 
+# Try to import orjson (optional, faster decoding of large API responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Crossref API endpoint (primary)
 CROSSREF_API_BASE = "https://api.crossref.org"
 MAILTO_EMAIL = os.environ.get('CROSSREF_MAILTO', 'research@example.com')
+USER_AGENT = f'biblatex-diagnostics/1.0 (https://github.com/JPinnell/Biblatex_check; mailto:{MAILTO_EMAIL})'
+# Default delay between Crossref queries; identified (polite pool) clients get a faster queue
+CROSSREF_DELAY = 0.05 if MAILTO_EMAIL == 'research@example.com' else 0.02  # seconds
+
+# Connection pool size for the shared HTTP session
+HTTP_POOL_SIZE = 16
+# Automatic retries (with exponential backoff) for transient server errors
+HTTP_RETRIES = 3
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+# DOIs looked up per Crossref request when prefetching (filter=doi:...,doi:...)
+CROSSREF_DOI_BATCH_SIZE = 50
+# Concurrent Crossref title searches when prefetching (still paced by --delay)
+DEFAULT_WORKERS = 8
+# Wait after an HTTP 429 that carries no usable Retry-After header
+RETRY_AFTER_DEFAULT = 5.0  # seconds
+# Crossref record fields the checks and updates read; select= keeps responses small
+CROSSREF_SELECT = ('DOI,title,author,published,published-print,container-title,volume,issue,page,'
+                   'publisher,ISBN,ISSN,type')
+
+# On-disk cache of API responses, so re-runs skip queries already answered
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'biblatex_check')
+API_CACHE_FILE = os.path.join(CACHE_DIR, 'api_responses.sqlite3')
+API_CACHE_TTL = 30 * 24 * 3600  # seconds
 
 # Semantic Scholar API endpoint (fallback)
 SEMANTIC_SCHOLAR_API_BASE = "https://api.semanticscholar.org/graph/v1"
 SEMANTIC_SCHOLAR_API_KEY = os.environ.get('SEMANTIC_SCHOLAR_API_KEY', None)
+SEMANTIC_SCHOLAR_DELAY = 1.0 if SEMANTIC_SCHOLAR_API_KEY else 5.0  # seconds between requests
+SEMANTIC_SCHOLAR_FIELDS = 'title,authors,year,venue,doi,publicationTypes,externalIds'
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500  # paper IDs per /paper/batch request (API maximum)
 
 # Name particles that should be ignored when comparing/sorting author names
-NAME_PARTICLES = {'von', 'van', 'de', 'del', 'della', 'di', 'du', 'le', 'la', 'da', 'dos', 'das', 'ten', 'ter', 'den', 'der'}
-NAME_SUFFIXES = {'jr', 'jr.', 'sr', 'sr.', 'ii', 'iii', 'iv', 'v'}
-SKIPPED_ENTRY_TYPES = {'phdthesis', 'misc', 'online'}
+NAME_PARTICLES = frozenset({'von', 'van', 'de', 'del', 'della', 'di', 'du', 'le', 'la', 'da', 'dos', 'das',
+                            'ten', 'ter', 'den', 'der'})
+NAME_SUFFIXES = frozenset({'jr', 'jr.', 'sr', 'sr.', 'ii', 'iii', 'iv', 'v'})
+SKIPPED_ENTRY_TYPES = frozenset({'phdthesis', 'misc', 'online'})
+# Words that do not distinguish journal names, or make useful title search keywords
+JOURNAL_STOP_WORDS = frozenset({'of', 'the', 'and', 'for', 'in', 'on'})
+TITLE_STOP_WORDS = frozenset({'the', 'a', 'an', 'of', 'in', 'on', 'at', 'to', 'for', 'with', 'and', 'or', 'but'})
+# Title values that are placeholders rather than something worth searching for
+PLACEHOLDER_TITLES = frozenset({'tba', 'tbd', 'todo', 'untitled', 'no title', 'title', 'unknown', 'n/a', '???'})
+
+# Titles match when the harmonic mean of word Jaccard and containment exceeds this
+TITLE_MATCH_THRESHOLD = 0.75
+
+# LaTeX accent commands stripped by normalize_latex_text
+LATEX_ACCENT_COMMANDS = (r"\'", r'\`', r'\^', r'\"', r'\~', r'\=', r'\.',
+                         r'\u', r'\v', r'\H', r'\c', r'\k', r'\r')
+
+# Precompiled patterns (these run for every name and title comparison)
+_RE_PUNCT = re.compile(r'[^\w\s]')
+# ASCII titles: lowercase and drop the characters _RE_PUNCT matches in one translate pass
+_ASCII_TITLE_TABLE = str.maketrans(
+    {chr(c): (chr(c).lower() if not _RE_PUNCT.match(chr(c)) else None) for c in range(128)}
+)
+_RE_NAME_PUNCT = re.compile(r"[-'`]")
+# &amp; and \& in one pass; \&amp; is listed so it still folds to a single &
+_RE_AMPERSAND = re.compile(r'\\?&amp;|\\&')
+_RE_KEY_YEAR = re.compile(r'(19|20)\d{2}')
+_RE_DASH = re.compile(r'[-–—]')
+_RE_NAME_SEPARATORS = re.compile(r'[\s\-]+')
+_RE_BRACED = re.compile(r'\{([^}]*)\}')
+_RE_COMMAND_ARG = re.compile(r'\\[a-zA-Z]+\{([^}]*)\}')
+_RE_COMMAND = re.compile(r'\\[a-zA-Z]+')
+# Any accent command applied to a letter, as \cmd{x} or \cmdx (surrounding braces are
+# stripped afterwards, so {\cmd{x}} and {\cmdx} need no separate alternatives)
+_RE_LATEX_ACCENT = re.compile(
+    r'\\[' + ''.join(re.escape(cmd[1]) for cmd in LATEX_ACCENT_COMMANDS) + r']'
+    r'(?:\{([a-zA-Z])\}|([a-zA-Z]))'
+)
 
 
 def clean_filepath(filepath: str) -> str:
@@ -61,6 +139,7 @@ def clean_filepath(filepath: str) -> str:
     return cleaned
 
 
+@lru_cache(maxsize=8192)
 def remove_accents(text: str) -> str:
     """
     Remove accents from Unicode string and normalize special characters.
@@ -68,6 +147,10 @@ def remove_accents(text: str) -> str:
     Handles both combining accents (NFD decomposition) and special base characters
     like ø, æ, œ that don't decompose in NFD.
     """
+    # Plain ASCII (most bibliography data) has nothing to fold
+    if text.isascii():
+        return text
+
     # First, replace special Unicode characters that don't decompose in NFD
     # These are distinct base characters, not letter + combining mark
     special_unicode_chars = {
@@ -83,6 +166,8 @@ def remove_accents(text: str) -> str:
 
     for char, replacement in special_unicode_chars.items():
         text = text.replace(char, replacement)
+    if text.isascii():
+        return text
 
     # Normalize to NFD (decomposed form) to handle combining accents
     nfd = unicodedata.normalize('NFD', text)
@@ -90,6 +175,11 @@ def remove_accents(text: str) -> str:
     return ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
 
 
+def _accent_letter(match: re.Match) -> str:
+    return match.group(1) or match.group(2)
+
+
+@lru_cache(maxsize=8192)
 def normalize_latex_text(text: str) -> str:
     """
     Normalize LaTeX text by converting LaTeX accents to their Unicode equivalents,
@@ -102,106 +192,126 @@ def normalize_latex_text(text: str) -> str:
         Berg-Sørensen -> BergSorensen
         Berg-S{\\o}rensen -> BergSorensen
     """
-    # Special LaTeX characters (must be handled before accent commands)
-    # These are complete character replacements, not accents
-    special_chars = {
-        r'{\o}': 'o',
-        r'\o{}': 'o',
-        r'\o ': 'o',
-        r'\o': 'o',
-        r'{\O}': 'O',
-        r'\O{}': 'O',
-        r'\O ': 'O',
-        r'\O': 'O',
-        r'{\aa}': 'aa',
-        r'\aa{}': 'aa',
-        r'\aa ': 'aa',
-        r'\aa': 'aa',
-        r'{\AA}': 'AA',
-        r'\AA{}': 'AA',
-        r'\AA ': 'AA',
-        r'\AA': 'AA',
-        r'{\ae}': 'ae',
-        r'\ae{}': 'ae',
-        r'\ae ': 'ae',
-        r'\ae': 'ae',
-        r'{\AE}': 'AE',
-        r'\AE{}': 'AE',
-        r'\AE ': 'AE',
-        r'\AE': 'AE',
-        r'{\oe}': 'oe',
-        r'\oe{}': 'oe',
-        r'\oe ': 'oe',
-        r'\oe': 'oe',
-        r'{\OE}': 'OE',
-        r'\OE{}': 'OE',
-        r'\OE ': 'OE',
-        r'\OE': 'OE',
-        r'{\ss}': 'ss',
-        r'\ss{}': 'ss',
-        r'\ss ': 'ss',
-        r'\ss': 'ss',
-    }
-
-    # Dotless base characters that are often combined with accent commands
-    base_letters = {
-        r'\i': 'i',
-        r'\j': 'j',
-        r'\l': 'l',
-        r'\L': 'L',
-    }
-
-    # Replace special characters (order matters - longer patterns first)
-    for latex_cmd, replacement in special_chars.items():
-        text = text.replace(latex_cmd, replacement)
-
-    # Replace base letters so accent removal works on LaTeX sequences like {\'{\i}}
-    for base_cmd, replacement in base_letters.items():
-        text = text.replace(base_cmd, replacement)
-
-    # Common LaTeX accent commands
-    latex_accents = {
-        r"\'": '',  # acute
-        r'\`': '',  # grave
-        r'\^': '',  # circumflex
-        r'\"': '',  # umlaut
-        r'\~': '',  # tilde
-        r'\=': '',  # macron
-        r'\.': '',  # dot above
-        r'\u': '',  # breve
-        r'\v': '',  # caron
-        r'\H': '',  # double acute
-        r'\c': '',  # cedilla
-        r'\k': '',  # ogonek
-        r'\r': '',  # ring above
-    }
-
-    # Handle braced accent commands like {\'e}
-    for cmd in latex_accents.keys():
-        # Match patterns like {\cmd{letter}} or {\\cmd letter}
-        text = re.sub(r'\{' + re.escape(cmd) + r'\{([a-zA-Z])\}\}', r'\1', text)
-        text = re.sub(r'\{' + re.escape(cmd) + r'([a-zA-Z])\}', r'\1', text)
-        text = re.sub(re.escape(cmd) + r'\{([a-zA-Z])\}', r'\1', text)
-        text = re.sub(re.escape(cmd) + r'([a-zA-Z])', r'\1', text)
+    # Every LaTeX command starts with a backslash; most names and titles have none
+    if '\\' in text:
+        # Special LaTeX characters (must be handled before accent commands)
+        # These are complete character replacements, not accents
+        special_chars = {
+            r'{\o}': 'o',
+            r'\o{}': 'o',
+            r'\o ': 'o',
+            r'\o': 'o',
+            r'{\O}': 'O',
+            r'\O{}': 'O',
+            r'\O ': 'O',
+            r'\O': 'O',
+            r'{\aa}': 'aa',
+            r'\aa{}': 'aa',
+            r'\aa ': 'aa',
+            r'\aa': 'aa',
+            r'{\AA}': 'AA',
+            r'\AA{}': 'AA',
+            r'\AA ': 'AA',
+            r'\AA': 'AA',
+            r'{\ae}': 'ae',
+            r'\ae{}': 'ae',
+            r'\ae ': 'ae',
+            r'\ae': 'ae',
+            r'{\AE}': 'AE',
+            r'\AE{}': 'AE',
+            r'\AE ': 'AE',
+            r'\AE': 'AE',
+            r'{\oe}': 'oe',
+            r'\oe{}': 'oe',
+            r'\oe ': 'oe',
+            r'\oe': 'oe',
+            r'{\OE}': 'OE',
+            r'\OE{}': 'OE',
+            r'\OE ': 'OE',
+            r'\OE': 'OE',
+            r'{\ss}': 'ss',
+            r'\ss{}': 'ss',
+            r'\ss ': 'ss',
+            r'\ss': 'ss',
+        }
+
+        # Dotless base characters that are often combined with accent commands
+        base_letters = {
+            r'\i': 'i',
+            r'\j': 'j',
+            r'\l': 'l',
+            r'\L': 'L',
+        }
+
+        # Replace special characters (order matters - longer patterns first)
+        for latex_cmd, replacement in special_chars.items():
+            text = text.replace(latex_cmd, replacement)
+
+        # Replace base letters so accent removal works on LaTeX sequences like {\'{\i}}
+        for base_cmd, replacement in base_letters.items():
+            text = text.replace(base_cmd, replacement)
+
+        # Handle accent commands like {\'e}; repeat so stacked accents such as \'{\"u} are
+        # fully stripped whichever command is innermost
+        count = 1
+        while count:
+            text, count = _RE_LATEX_ACCENT.subn(_accent_letter, text)
 
     # Remove any remaining braces
     text = text.replace('{', '').replace('}', '')
 
     # Remove accents from any Unicode characters (handles Unicode like ø, ö, ä, etc.)
-    text = remove_accents(text)
+    if not text.isascii():
+        text = remove_accents(text)
 
     # Remove hyphens, apostrophes, and other punctuation that shouldn't affect name matching
     # This helps match 'Rosales-Guzmán' with 'RosalesGuzman' in citation keys
-    text = re.sub(r'[-\'`]', '', text)
+    text = _RE_NAME_PUNCT.sub('', text)
 
     return text
 
 
+@lru_cache(maxsize=4096)
+def title_words(title: str) -> FrozenSet[str]:
+    """
+    Lowercased words of a title with punctuation removed, for word-overlap comparisons.
+    Accents are folded (naïve -> naive), so accented and ASCII spellings compare equal.
+    Cached, since the local title is compared against every API result for its entry.
+    """
+    if not title.isascii():
+        title = remove_accents(title)
+    if title.isascii():
+        return frozenset(title.translate(_ASCII_TITLE_TABLE).split())
+    return frozenset(_RE_PUNCT.sub('', title.lower()).split())
+
+
+def json_loads(data):
+    """Decode JSON text or bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data) -> str:
+    """Encode data as JSON text, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+
+def is_searchable(entry: Entry) -> bool:
+    """True if the entry has a DOI or a real title (not empty, punctuation-only or a placeholder)."""
+    if entry.fields.get('doi', '').strip():
+        return True
+    title = entry.fields.get('title', '').strip('{}').strip()
+    return bool(title_words(title)) and title.lower() not in PLACEHOLDER_TITLES
+
+
 def normalize_ampersand(text: str) -> str:
     """Normalize ampersands for comparison: &amp; -> & and \\& -> &"""
-    text = text.replace('&amp;', '&')
-    text = text.replace('\\&', '&')
-    return text
+    if '&' not in text:
+        return text
+    return _RE_AMPERSAND.sub('&', text)
 
 
 def clean_api_field(text: str) -> str:
@@ -216,6 +326,7 @@ def clean_api_field(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=4096)
 def normalize_journal_name(journal: str) -> str:
     """
     Normalize journal name for comparison by:
@@ -232,6 +343,8 @@ def normalize_journal_name(journal: str) -> str:
         'Particle {\\&} Systems' -> 'particle & systems'
         'Phys. Chem. Chem. Phys.' -> 'phys chem chem phys'
         'J. of Electrical Engineering' -> 'j of electrical engineering'
+
+    Cached, since the same journals recur across entries and API results.
     """
     # Convert to lowercase
     journal = journal.lower()
@@ -287,9 +400,8 @@ def journals_match_fuzzy(journal1: str, journal2: str, threshold: float = 0.6) -
         return False
 
     # Filter out common words that don't help distinguish journals
-    stop_words = {'of', 'the', 'and', 'for', 'in', 'on'}
-    words1_filtered = words1 - stop_words
-    words2_filtered = words2 - stop_words
+    words1_filtered = words1 - JOURNAL_STOP_WORDS
+    words2_filtered = words2 - JOURNAL_STOP_WORDS
 
     # Check for exact word matches
     intersection = len(words1.intersection(words2))
@@ -427,7 +539,7 @@ def normalize_with_transliterations(text: str) -> List[str]:
         variant = variant.replace('å', 'aa').replace('Å', 'Aa')
         variant = variant.replace('œ', 'oe').replace('Œ', 'Oe')
         # Now normalize the variant (remove LaTeX, hyphens, etc.)
-        variant = re.sub(r'[-\'`]', '', variant).lower()
+        variant = _RE_NAME_PUNCT.sub('', variant).lower()
         if variant != base and variant not in variants:
             variants.append(variant)
 
@@ -453,7 +565,7 @@ def extract_citation_key_components(citation_key: str) -> Tuple[Optional[str], O
         (author_lastname, year) tuple, or (None, None) if pattern not recognized
     """
     # Pattern 1: Look for 4-digit year (1900-2099)
-    year_match = re.search(r'(19|20)\d{2}', citation_key)
+    year_match = _RE_KEY_YEAR.search(citation_key)
     if not year_match:
         return (None, None)
 
@@ -471,7 +583,8 @@ def extract_citation_key_components(citation_key: str) -> Tuple[Optional[str], O
     return (author_normalized, year)
 
 
-def extract_author_components(person_str: str) -> Tuple[str, str, List[str]]:
+@lru_cache(maxsize=8192)
+def extract_author_components(person_str: str) -> Tuple[str, str, Tuple[str, ...]]:
     """
     Extract last name, initials, and particles from author name.
 
@@ -479,9 +592,12 @@ def extract_author_components(person_str: str) -> Tuple[str, str, List[str]]:
         (lastname, initials, particles) tuple
 
     Examples:
-        "John von Neumann" -> ("neumann", "J", ["von"])
-        "De Gennes, Pierre-Gilles" -> ("gennes", "PG", ["de"])
-        "Smith Jr., John" -> ("smith", "J", ["jr"])
+        "John von Neumann" -> ("neumann", "J", ("von",))
+        "De Gennes, Pierre-Gilles" -> ("gennes", "PG", ("de",))
+        "Smith Jr., John" -> ("smith", "J", ("jr",))
+
+    Cached, since co-authors and editors recur across a bibliography; the
+    particles are returned as a tuple so cached results cannot be mutated.
     """
     person_str = person_str.strip()
     particles = []
@@ -499,8 +615,9 @@ def extract_author_components(person_str: str) -> Tuple[str, str, List[str]]:
             # Check if any leading words are particles
             particle_count = 0
             for word in last_parts_words[:-1]:  # All words except the last
-                if word.lower() in NAME_PARTICLES:
-                    particles.append(word.lower())
+                word = word.lower()
+                if word in NAME_PARTICLES:
+                    particles.append(word)
                     particle_count += 1
                 else:
                     break  # Stop at first non-particle
@@ -512,20 +629,21 @@ def extract_author_components(person_str: str) -> Tuple[str, str, List[str]]:
         # Space-separated format
         parts = person_str.split()
         if len(parts) == 0:
-            return ('', '', [])
+            return ('', '', ())
         elif len(parts) == 1:
-            return (normalize_latex_text(parts[0]).lower(), '', [])
+            return (normalize_latex_text(parts[0]).lower(), '', ())
 
         # Find the last name (rightmost non-particle, non-suffix word)
         last_idx = len(parts) - 1
 
         # Check if last word is a suffix
-        if parts[last_idx].lower().rstrip('.') in NAME_SUFFIXES:
-            particles.append(parts[last_idx].lower().rstrip('.'))
+        suffix = parts[last_idx].lower().rstrip('.')
+        if suffix in NAME_SUFFIXES:
+            particles.append(suffix)
             last_idx -= 1
 
         if last_idx < 0:
-            return ('', '', particles)
+            return ('', '', tuple(particles))
 
         last_part = parts[last_idx]
         first_part = ' '.join(parts[:last_idx])
@@ -546,10 +664,11 @@ def extract_author_components(person_str: str) -> Tuple[str, str, List[str]]:
         # Remove LaTeX formatting and get first letters
         first_normalized = normalize_latex_text(first_part)
         # Split by spaces and hyphens
-        name_parts = re.split(r'[\s\-]+', first_normalized)
+        name_parts = _RE_NAME_SEPARATORS.split(first_normalized)
         for part in name_parts:
             part = part.strip()
-            if part and part.lower() not in NAME_PARTICLES and part.lower().rstrip('.') not in NAME_SUFFIXES:
+            lower_part = part.lower()
+            if part and lower_part not in NAME_PARTICLES and lower_part.rstrip('.') not in NAME_SUFFIXES:
                 # Check if this part is grouped initials (e.g., "NC", "ABC")
                 # Grouped initials are: all uppercase, 2-4 letters, no dots
                 part_no_dots = part.replace('.', '')
@@ -560,23 +679,13 @@ def extract_author_components(person_str: str) -> Tuple[str, str, List[str]]:
                     # Regular name part - add first letter only
                     initials += part[0].upper()
 
-    return (lastname, initials, particles)
+    return (lastname, initials, tuple(particles))
 
 
 def check_unclosed_math_mode(text: str) -> bool:
     """Check if there are unclosed $ symbols in LaTeX text."""
-    # Count $ symbols that aren't escaped
-    dollar_count = 0
-    i = 0
-    while i < len(text):
-        if text[i] == '$':
-            # Check if it's escaped
-            if i == 0 or text[i-1] != '\\':
-                dollar_count += 1
-        i += 1
-
-    # Should be even (each opening $ has a closing $)
-    return dollar_count % 2 != 0
+    # Count $ symbols that aren't escaped (\$); should be even (each opening $ has a closing $)
+    return (text.count('$') - text.count('\\$')) % 2 != 0
 
 
 def check_page_range_format(pages: str) -> Optional[str]:
@@ -584,38 +693,120 @@ def check_page_range_format(pages: str) -> Optional[str]:
     Check if page range uses double hyphen (--).
     Returns error message if format is wrong, None if correct.
     """
-    if not pages or '--' in pages:
-        return None  # Already correct or no pages
+    # Already correct, no pages, or a single page (no dash of any kind)
+    if not pages or '--' in pages or not _RE_DASH.search(pages):
+        return None
 
-    # Check for single dash or other dash characters
-    if '-' in pages or '–' in pages or '—' in pages:
-        return f"Page range should use double hyphen '--' not single dash: '{pages}'"
+    return f"Page range should use double hyphen '--' not single dash: '{pages}'"
 
-    return None
+
+def crossref_request_interval(headers) -> Optional[float]:
+    """
+    Seconds per request advertised by Crossref's X-Rate-Limit-Limit / X-Rate-Limit-Interval
+    headers (e.g. 50 and '1s' -> 0.02), or None if they are missing or malformed.
+    """
+    limit = headers.get('X-Rate-Limit-Limit', '')
+    interval = headers.get('X-Rate-Limit-Interval', '').strip().lower()
+    if not limit.isdigit() or int(limit) == 0 or not interval.endswith('s'):
+        return None
+    try:
+        return float(interval[:-1]) / int(limit)
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(headers) -> float:
+    """Seconds to wait according to a Retry-After header (delta-seconds form only)."""
+    retry_after = headers.get('Retry-After', '').strip()
+    if retry_after.isdigit():
+        return float(retry_after)
+    return RETRY_AFTER_DEFAULT
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: up to `burst` requests at once, refilled at one per `interval` seconds.
+    Callers only wait when a request would actually exceed the rate, so time already spent
+    waiting on a slow response counts towards the interval.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        if self.interval <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+            self.updated = now
+            wait = (1 - self.tokens) * self.interval if self.tokens < 1 else 0.0
+            # May go negative: the token is reserved, so concurrent callers queue up behind it
+            self.tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
 
 
 class BibTeXAPIChecker:
     """Validates BibTeX entries against online APIs (Crossref + Semantic Scholar + Scholarly)."""
 
-    def __init__(self, verbose: bool = False, delay: float = 0.05, use_scholarly: bool = True):
+    def __init__(self, verbose: bool = False, delay: float = CROSSREF_DELAY, use_scholarly: bool = True,
+                 use_cache: bool = True, workers: int = DEFAULT_WORKERS, refresh_cache: bool = False):
         """
         Initialize the API checker.
 
         Args:
             verbose: Enable verbose output
-            delay: Delay between Crossref API queries (default: 0.05s for 20 req/sec)
+            delay: Delay between Crossref API queries (default: CROSSREF_DELAY, 0.02s with
+                   CROSSREF_MAILTO set, otherwise 0.05s)
             use_scholarly: Enable Scholarly API (requires scholarly package)
+            use_cache: Reuse Crossref/Semantic Scholar responses cached on disk
+            workers: Number of Crossref title searches prefetched concurrently
+            refresh_cache: Query the APIs again and overwrite the cached responses
         """
         self.verbose = verbose
         self.delay = delay
+        self.workers = max(1, workers)
         self.use_scholarly = use_scholarly and SCHOLARLY_AVAILABLE
         self.matches = []
+        self.matched_keys = set()  # entry_id of every match, for O(1) lookups
+        self.matched_keys_by_source = {}  # source -> set of matched entry_ids
         self.mismatches = []
         self.not_found = []
+        self.doi_records = {}  # lowercase DOI -> Crossref work, filled by prefetch_crossref_dois
+        self.s2_records = {}  # lowercase DOI -> Semantic Scholar paper, filled by prefetch_semantic_scholar_dois
         self.field_mismatches = []  # Track field-level mismatches
         self.suggestions = []  # Track close matches for not-found entries
         self.scholarly_session_active = False  # Track if Scholarly session is active
 
+        # Shared HTTP session: reuses TCP/TLS connections across all API queries
+        self.session = requests.Session()
+        # HTTP 429 is handled in _get_json, so the rate limiter sees it
+        retries = Retry(total=HTTP_RETRIES, backoff_factor=0.5, status_forcelist=HTTP_RETRY_STATUSES,
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                              max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['User-Agent'] = USER_AGENT
+
+        # API responses of this run (key -> JSON), shared by the prefetch threads and the checks
+        self.responses = {}
+        self.cache = self._open_cache() if use_cache else None
+        self.refresh_cache = refresh_cache
+        self.cache_lock = threading.Lock()
+
+        # Per-API request pacing, applied only to requests that actually go to the network
+        self.rate_limiters = {
+            CROSSREF_API_BASE: RateLimiter(delay),
+            SEMANTIC_SCHOLAR_API_BASE: RateLimiter(SEMANTIC_SCHOLAR_DELAY),
+        }
+
         # Initialize Scholarly session once (keep session alive for multiple queries)
         if self.use_scholarly:
             try:
@@ -634,6 +825,196 @@ class BibTeXAPIChecker:
         if self.verbose:
             print(f"[INFO] {message}")
 
+    def _open_cache(self) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the API response cache, or None if unavailable."""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Prefetch threads share the connection; cache_lock serialises access
+            cache = sqlite3.connect(API_CACHE_FILE, check_same_thread=False)
+            cache.execute('CREATE TABLE IF NOT EXISTS responses '
+                          '(key BLOB PRIMARY KEY, response TEXT, fetched_at INTEGER)')
+            return cache
+        except (OSError, sqlite3.Error) as e:
+            self.log(f"Warning: API response cache disabled: {e}")
+            return None
+
+    def _get_json(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Dict:
+        """
+        GET url and return the decoded JSON body, consulting this run's responses and the
+        on-disk cache first. Only successful responses are cached; HTTP errors propagate as before.
+        """
+        request_id = json.dumps([url, params], sort_keys=True)
+        key = hashlib.blake2b(request_id.encode('utf-8'), digest_size=16).digest()
+        data = self.responses.get(key)
+        if data is not None:
+            return data
+
+        if self.cache is not None and not self.refresh_cache:
+            try:
+                with self.cache_lock:
+                    row = self.cache.execute('SELECT response, fetched_at FROM responses WHERE key = ?',
+                                             (key,)).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row and time.time() - row[1] < API_CACHE_TTL:
+                self.log("Using cached API response")
+                data = json_loads(row[0])
+                self.responses[key] = data
+                return data
+
+        limiter = next((limiter for base, limiter in self.rate_limiters.items()
+                        if url.startswith(base)), None)
+        for attempt in range(2):
+            if limiter is not None:
+                limiter.acquire()
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
+
+            # Follow the rate Crossref advertises, but never go faster than --delay
+            if url.startswith(CROSSREF_API_BASE):
+                interval = crossref_request_interval(response.headers)
+                if interval is not None:
+                    limiter.interval = max(self.delay, interval)
+
+            if response.status_code != 429 or attempt:
+                break
+            wait = retry_after_seconds(response.headers)
+            self.log(f"Rate limited (HTTP 429), retrying in {wait:.1f}s")
+            time.sleep(wait)
+        response.raise_for_status()
+        data = json_loads(response.content) if ORJSON_AVAILABLE else response.json()
+        self.responses[key] = data
+
+        if self.cache is not None:
+            try:
+                with self.cache_lock, self.cache:
+                    self.cache.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?)',
+                                       (key, json_dumps(data), int(time.time())))
+            except sqlite3.Error as e:
+                self.log(f"Could not write API response cache: {e}")
+        return data
+
+    def _get_crossref_doi(self, doi: str) -> Dict:
+        """Return the Crossref /works/{doi} response, using a prefetched record if there is one."""
+        record = self.doi_records.get(doi.lower())
+        if record is not None:
+            return {'message': record}
+        return self._get_json(f"{CROSSREF_API_BASE}/works/{doi}")
+
+    def prefetch_crossref_dois(self, entries: List[Entry]):
+        """
+        Fetch the Crossref records of all DOIs in entries, CROSSREF_DOI_BATCH_SIZE per request.
+        DOIs missing from the batch results are still looked up one by one later.
+        """
+        dois = []
+        seen = set(self.doi_records)
+        for entry in entries:
+            doi = entry.fields.get('doi', '').strip()
+            # A comma would split the filter value, so such DOIs keep the single lookup
+            if doi and ',' not in doi and doi.lower() not in seen:
+                seen.add(doi.lower())
+                dois.append(doi)
+
+        if not dois:
+            return
+        self.log(f"Prefetching {len(dois)} DOI(s) from Crossref")
+
+        for start in range(0, len(dois), CROSSREF_DOI_BATCH_SIZE):
+            batch = dois[start:start + CROSSREF_DOI_BATCH_SIZE]
+            params = {
+                'filter': ','.join(f"doi:{doi}" for doi in batch),
+                'rows': len(batch),
+                'select': CROSSREF_SELECT,
+            }
+            try:
+                data = self._get_json(f"{CROSSREF_API_BASE}/works", params=params)
+            except Exception as e:
+                self.log(f"DOI prefetch failed: {str(e)}, falling back to single lookups")
+                continue
+            for record in (data.get('message') or {}).get('items', []):
+                if record.get('DOI'):
+                    self.doi_records[record['DOI'].lower()] = record
+
+    def _semantic_scholar_headers(self) -> Dict:
+        """Request headers for Semantic Scholar (with the API key, if configured)."""
+        headers = {'User-Agent': 'biblatex-diagnostics/1.0'}
+        if SEMANTIC_SCHOLAR_API_KEY:
+            headers['x-api-key'] = SEMANTIC_SCHOLAR_API_KEY
+        return headers
+
+    def prefetch_semantic_scholar_dois(self, entries: List[Entry]):
+        """
+        Look up on Semantic Scholar, SEMANTIC_SCHOLAR_BATCH_SIZE per request, the DOIs that the
+        Crossref prefetch did not return, so their fallback needs no throttled title search.
+        """
+        dois = []
+        seen = set(self.s2_records)
+        for entry in entries:
+            doi = entry.fields.get('doi', '').strip().lower()
+            if doi and doi not in self.doi_records and doi not in seen:
+                seen.add(doi)
+                dois.append(doi)
+
+        if not dois:
+            return
+        self.log(f"Prefetching {len(dois)} DOI(s) from Semantic Scholar")
+
+        batch_url = f"{SEMANTIC_SCHOLAR_API_BASE}/paper/batch"
+        for start in range(0, len(dois), SEMANTIC_SCHOLAR_BATCH_SIZE):
+            batch = dois[start:start + SEMANTIC_SCHOLAR_BATCH_SIZE]
+            self.rate_limiters[SEMANTIC_SCHOLAR_API_BASE].acquire()
+            try:
+                response = self.session.post(batch_url, params={'fields': SEMANTIC_SCHOLAR_FIELDS},
+                                             json={'ids': [f"DOI:{doi}" for doi in batch]},
+                                             headers=self._semantic_scholar_headers(), timeout=30)
+                response.raise_for_status()
+                results = json_loads(response.content) if ORJSON_AVAILABLE else response.json()
+            except Exception as e:
+                self.log(f"Semantic Scholar DOI prefetch failed: {str(e)}, falling back to title search")
+                continue
+            # Results are in request order, with null for unknown IDs
+            for doi, result in zip(batch, results):
+                if result:
+                    self.s2_records[doi] = result
+
+    def _crossref_title_params(self, title: str) -> Dict:
+        """Query parameters of the Crossref title search (shared with the prefetch, so both hit one cache key)."""
+        return {
+            'query.title': title,
+            'rows': 5,  # Get multiple results for suggestions
+            'select': CROSSREF_SELECT
+        }
+
+    def prefetch_crossref_titles(self, entries: List[Entry]):
+        """
+        Run the Crossref title searches for entries concurrently (self.workers threads), so the
+        per-entry checks find them already answered. Entries resolved by a prefetched DOI are
+        skipped, since check_crossref never searches their title.
+        """
+        titles = []
+        seen = set()
+        for entry in entries:
+            title = entry.fields.get('title', '').strip('{}').strip()
+            doi = entry.fields.get('doi', '').strip()
+            if title and title not in seen and (not doi or doi.lower() not in self.doi_records):
+                seen.add(title)
+                titles.append(title)
+
+        if self.workers < 2 or len(titles) < 2:
+            return
+        self.log(f"Prefetching {len(titles)} Crossref title search(es) with {self.workers} workers")
+
+        search_url = f"{CROSSREF_API_BASE}/works"
+
+        def fetch(title: str):
+            try:
+                self._get_json(search_url, params=self._crossref_title_params(title))
+            except Exception as e:
+                # check_crossref retries and reports the failure for this entry
+                self.log(f"Title prefetch failed: {str(e)}")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(fetch, titles))
+
     def load_bibtex(self, filepath: str) -> BibliographyData:
         """Load a BibTeX file."""
         self.log(f"Loading BibTeX file: {filepath}")
@@ -673,59 +1054,57 @@ class BibTeXAPIChecker:
         Save BibTeX database to file preserving original formatting.
         CRITICAL: Does NOT modify any existing field values - writes them exactly as stored.
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
             for key, entry in bib_data.entries.items():
-                # Write entry header
-                f.write(f"@{entry.type}{{{key},\n")
-
-                # Collect all items (persons + fields) to determine last item
-                items = []
-
-                # Add persons (author, editor, etc.)
-                for role, persons in entry.persons.items():
-                    if persons:
-                        names = []
-                        for person in persons:
-                            names.append(str(person))
-                        author_str = ' and '.join(names)
-                        items.append(('person', role, author_str))
-
-                # Add fields - preserve EXACT values, don't modify braces
-                for field, value in entry.fields.items():
-                    items.append(('field', field, value))
-
-                # Write all items with commas except the last
-                for idx, (item_type, name, value) in enumerate(items):
-                    is_last = (idx == len(items) - 1)
-                    comma = '' if is_last else ','
-
-                    # Write value EXACTLY as it is stored - DO NOT add/remove braces
-                    # The value is already in the correct format from the original file
-                    f.write(f"    {name} = {{{value}}}{comma}\n")
-
-                # Close entry
-                f.write("}\n\n")
+                # One "name = {value}" line per person role (author, editor, etc.) and field
+                lines = [
+                    f"    {role} = {{{' and '.join(str(person) for person in persons)}}}"
+                    for role, persons in entry.persons.items() if persons
+                ]
+                # Write value EXACTLY as it is stored - DO NOT add/remove braces
+                # The value is already in the correct format from the original file
+                lines.extend(f"    {field} = {{{value}}}" for field, value in entry.fields.items())
+
+                # Commas between items, none after the last; one write per entry
+                text = f"@{entry.type}{{{key},\n"
+                if lines:
+                    text += ',\n'.join(lines) + "\n"
+                f.write(text + "}\n\n")
 
         self.log(f"Saved corrected BibTeX to: {filepath}")
 
-    def _titles_match(self, title1: str, title2: str) -> bool:
-        """Check if two titles match using fuzzy matching."""
-        # Remove common punctuation and extra spaces
-        clean1 = re.sub(r'[^\w\s]', '', title1.lower()).strip()
-        clean2 = re.sub(r'[^\w\s]', '', title2.lower()).strip()
+    def _record_match(self, match: Dict):
+        """Record an API match and index it by entry key and source."""
+        self.matches.append(match)
+        self.matched_keys.add(match['entry_id'])
+        self.matched_keys_by_source.setdefault(match['source'], set()).add(match['entry_id'])
 
-        # Calculate Jaccard similarity
-        words1 = set(clean1.split())
-        words2 = set(clean2.split())
+    def _titles_match(self, title1: str, title2: str) -> bool:
+        """
+        Check if two titles match using fuzzy matching: the harmonic mean of word Jaccard
+        (shared / all words) and containment (shared / words of the shorter title),
+        ignoring case and punctuation.
+        """
+        words1 = title_words(title1)
+        words2 = title_words(title2)
 
         if not words1 or not words2:
             return False
 
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        similarity = intersection / union if union > 0 else 0
+        # With r = min/max set size, Jaccard <= r and containment <= 1, so the score is at
+        # most 2r / (1 + r); below the threshold whenever r <= 0.6, no set ops needed
+        shorter, longer = sorted((len(words1), len(words2)))
+        if shorter <= 0.6 * longer:
+            return False
+
+        intersection = len(words1 & words2)
+        if not intersection:
+            return False
+        jaccard = intersection / (len(words1) + len(words2) - intersection)
+        containment = intersection / shorter
+        similarity = 2 * jaccard * containment / (jaccard + containment)
 
-        return similarity > 0.7  # 70% similarity threshold
+        return similarity > TITLE_MATCH_THRESHOLD
 
     def _compare_fields(self, key: str, entry: Entry, api_result: Dict, source: str):
         """Compare fields between local entry and API result (BibTeX/BibLaTeX agnostic)."""
@@ -810,9 +1189,11 @@ class BibTeXAPIChecker:
         if 'author' in entry.persons:
             entry_authors = entry.persons['author']
             entry_author_count = len(entry_authors)
+            # Format each Person once; the checks below all work on the formatted names
+            entry_author_strs = [str(p) for p in entry_authors]
 
             # Check for "et al." in author list
-            entry_author_str = ' and '.join([str(p) for p in entry_authors])
+            entry_author_str = ' and '.join(entry_author_strs)
             if 'et al.' in entry_author_str.lower():
                 issues.append("Found 'et al.' in author list - recommend changing to 'and others'")
 
@@ -821,14 +1202,13 @@ class BibTeXAPIChecker:
             # Flag if there are 5 or fewer REAL authors (not counting "others")
             if 'and others' in entry_author_str.lower():
                 # Count real authors (excluding "others")
-                real_author_count = sum(1 for p in entry_authors if str(p).lower() != 'others')
+                real_author_count = sum(1 for name in entry_author_strs if name.lower() != 'others')
                 if real_author_count <= 5:
                     issues.append(f"Found 'and others' with only {real_author_count} real authors - possible hallucination")
 
             # Extract entry author components (last name, initials, particles)
             entry_author_info = []
-            for person in entry_authors:
-                person_str = str(person)
+            for person_str in entry_author_strs:
                 lastname, initials, particles = extract_author_components(person_str)
                 entry_author_info.append({
                     'original': person_str,
@@ -940,6 +1320,10 @@ class BibTeXAPIChecker:
                             )
 
                 # Check for author order issues (compare all authors in sequence)
+                # First position of each API last name, to find misplaced authors without a rescan
+                api_positions = {}
+                for j, author in enumerate(api_author_info):
+                    api_positions.setdefault(author['lastname'], j)
                 max_check = min(len(entry_author_info), len(api_author_info))
                 for i in range(max_check):
                     entry_auth = entry_author_info[i]
@@ -956,17 +1340,13 @@ class BibTeXAPIChecker:
                     # Check last name and initials
                     if entry_auth['lastname'] != api_auth['lastname']:
                         # Check if this author appears elsewhere in the list (wrong order)
-                        found_elsewhere = False
-                        for j, other_api in enumerate(api_author_info):
-                            if j != i and entry_auth['lastname'] == other_api['lastname']:
-                                issues.append(
-                                    f"Author order mismatch at position {i+1}: "
-                                    f"'{entry_auth['original']}' should be at position {j+1}"
-                                )
-                                found_elsewhere = True
-                                break
-
-                        if not found_elsewhere:
+                        j = api_positions.get(entry_auth['lastname'])
+                        if j is not None:
+                            issues.append(
+                                f"Author order mismatch at position {i+1}: "
+                                f"'{entry_auth['original']}' should be at position {j+1}"
+                            )
+                        else:
                             # Author in entry but not in API at any position
                             issues.append(
                                 f"Author at position {i+1} not in API: '{entry_auth['original']}' vs '{api_auth['original']}'"
@@ -984,20 +1364,44 @@ class BibTeXAPIChecker:
                 'issues': issues
             })
 
+    def _crossref_suggestion(self, key: str, result: Dict, strategy: str) -> Dict:
+        """Suggestion record for a Crossref search result (first 3 authors, year, journal)."""
+        suggestion_authors = []
+        for author in (result.get('author') or ())[:3]:
+            given = author.get('given', '')
+            family = author.get('family', '')
+            if given and family:
+                suggestion_authors.append(f"{given} {family}")
+            elif family:
+                suggestion_authors.append(family)
+
+        published = result.get('published') or result.get('published-print') or {}
+        date_parts = (published.get('date-parts') or [[]])[0]
+        container_title = result.get('container-title', [])
+
+        return {
+            'entry_id': key,
+            'source': 'crossref',
+            'suggestion': ''.join(result.get('title', [])),
+            'authors': ', '.join(suggestion_authors) if suggestion_authors else 'N/A',
+            'year': str(date_parts[0]) if date_parts else 'N/A',
+            'journal': container_title[0] if container_title else 'N/A',
+            'doi': result.get('DOI', 'N/A'),
+            'strategy': strategy
+        }
+
     def check_crossref(self, key: str, entry: Entry, update: bool = False) -> Optional[Entry]:
         """Check entry against Crossref API."""
         title = entry.fields.get('title', '').strip('{}').strip()
         doi = entry.fields.get('doi', '').strip()
 
         # Get author names for additional search strategies
+        # (pybtex has already split each name, so read the last name instead of re-parsing str(person))
         author_names = []
         if 'author' in entry.persons:
             for person in entry.persons['author']:
-                # Get last name
-                person_str = str(person)
-                parts = person_str.split()
-                if parts:
-                    author_names.append(parts[-1])  # Last name
+                if person.last_names:
+                    author_names.append(person.last_names[-1])  # Last name
 
         entry_year = None
         if 'year' in entry.fields:
@@ -1007,7 +1411,6 @@ class BibTeXAPIChecker:
 
         try:
             search_url = f"{CROSSREF_API_BASE}/works"
-            headers = {'User-Agent': f'biblatex-diagnostics/1.0 (mailto:{MAILTO_EMAIL})'}
 
             # Track seen DOIs across all searches for this entry
             seen_dois = set()
@@ -1015,12 +1418,9 @@ class BibTeXAPIChecker:
             # STRATEGY 0: Search by DOI if available (most accurate)
             if doi:
                 self.log(f"Searching Crossref by DOI: {doi}")
-                doi_url = f"{CROSSREF_API_BASE}/works/{doi}"
 
                 try:
-                    response = requests.get(doi_url, headers=headers, timeout=10)
-                    response.raise_for_status()
-                    data = response.json()
+                    data = self._get_crossref_doi(doi)
 
                     if data.get('message'):
                         result = data['message']
@@ -1031,7 +1431,7 @@ class BibTeXAPIChecker:
                         title_matches = self._titles_match(entry_title_lower, api_title) if title else False
 
                         self.log(f"✓ Found by DOI on Crossref")
-                        self.matches.append({
+                        self._record_match({
                             'entry_id': key,
                             'source': 'crossref',
                             'title': title,
@@ -1054,15 +1454,7 @@ class BibTeXAPIChecker:
             self.log(f"Searching Crossref for: {title}")
 
             # Strategy 1: Search by title (get top 5 results)
-            params = {
-                'query.title': title,
-                'rows': 5,  # Get multiple results for suggestions
-                'select': 'DOI,title,author,published,container-title,volume,issue,page,publisher,ISBN,ISSN,type'
-            }
-
-            response = requests.get(search_url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(search_url, params=self._crossref_title_params(title))
 
             if data.get('message') and data['message'].get('items') and len(data['message']['items']) > 0:
                 results = data['message']['items']
@@ -1074,7 +1466,7 @@ class BibTeXAPIChecker:
 
                 if self._titles_match(entry_title, crossref_title):
                     self.log(f"✓ Match found on Crossref")
-                    self.matches.append({
+                    self._record_match({
                         'entry_id': key,
                         'source': 'crossref',
                         'title': title,
@@ -1097,38 +1489,7 @@ class BibTeXAPIChecker:
                         doi = result.get('DOI', '')
                         if doi and doi not in seen_dois:
                             seen_dois.add(doi)
-
-                            suggestion_title = ''.join(result.get('title', []))
-                            suggestion_authors = []
-                            for author in result.get('author', [])[:3]:  # First 3 authors
-                                given = author.get('given', '')
-                                family = author.get('family', '')
-                                if given and family:
-                                    suggestion_authors.append(f"{given} {family}")
-                                elif family:
-                                    suggestion_authors.append(family)
-
-                            # Extract year and journal
-                            published = result.get('published', {}) or result.get('published-print', {})
-                            suggestion_year = 'N/A'
-                            if published and 'date-parts' in published and published['date-parts']:
-                                date_parts = published['date-parts'][0]
-                                if date_parts and len(date_parts) > 0:
-                                    suggestion_year = str(date_parts[0])
-
-                            container_title = result.get('container-title', [])
-                            suggestion_journal = container_title[0] if container_title else 'N/A'
-
-                            self.suggestions.append({
-                                'entry_id': key,
-                                'source': 'crossref',
-                                'suggestion': suggestion_title,
-                                'authors': ', '.join(suggestion_authors) if suggestion_authors else 'N/A',
-                                'year': suggestion_year,
-                                'journal': suggestion_journal,
-                                'doi': result.get('DOI', 'N/A'),
-                                'strategy': 'title_search'
-                            })
+                            self.suggestions.append(self._crossref_suggestion(key, result, 'title_search'))
 
             # Strategy 2: If we have author names and year, try author + year search
             if author_names and entry_year and not self.matches:
@@ -1137,107 +1498,42 @@ class BibTeXAPIChecker:
                 params = {
                     'query': query,
                     'rows': 5,
-                    'select': 'DOI,title,author,published,container-title,volume,issue,page,publisher,ISBN,ISSN,type'
+                    'select': CROSSREF_SELECT
                 }
 
-                response = requests.get(search_url, params=params, headers=headers, timeout=10)
-                response.raise_for_status()
-                data = response.json()
+                data = self._get_json(search_url, params=params)
 
                 if data.get('message') and data['message'].get('items'):
                     for result in data['message']['items'][:5]:
                         doi = result.get('DOI', '')
                         if doi and doi not in seen_dois:
                             seen_dois.add(doi)
-
-                            suggestion_title = ''.join(result.get('title', []))
-                            suggestion_authors = []
-                            for author in result.get('author', [])[:3]:
-                                given = author.get('given', '')
-                                family = author.get('family', '')
-                                if given and family:
-                                    suggestion_authors.append(f"{given} {family}")
-                                elif family:
-                                    suggestion_authors.append(family)
-
-                            published = result.get('published', {}) or result.get('published-print', {})
-                            suggestion_year = 'N/A'
-                            if published and 'date-parts' in published and published['date-parts']:
-                                date_parts = published['date-parts'][0]
-                                if date_parts and len(date_parts) > 0:
-                                    suggestion_year = str(date_parts[0])
-
-                            container_title = result.get('container-title', [])
-                            suggestion_journal = container_title[0] if container_title else 'N/A'
-
-                            self.suggestions.append({
-                                'entry_id': key,
-                                'source': 'crossref',
-                                'suggestion': suggestion_title,
-                                'authors': ', '.join(suggestion_authors) if suggestion_authors else 'N/A',
-                                'year': suggestion_year,
-                                'journal': suggestion_journal,
-                                'doi': result.get('DOI', 'N/A'),
-                                'strategy': 'author_year'
-                            })
+                            self.suggestions.append(self._crossref_suggestion(key, result, 'author_year'))
 
             # Strategy 3: If we have author names, try searching by author + title keywords
             if author_names and not self.matches:
                 self.log(f"Trying author+keywords search with {author_names[0]}")
                 # Take key words from title
-                title_words = title.lower().split()
+                words = title.lower().split()
                 # Remove common words
-                stop_words = {'the', 'a', 'an', 'of', 'in', 'on', 'at', 'to', 'for', 'with', 'and', 'or', 'but'}
-                key_words = [w for w in title_words if w not in stop_words and len(w) > 3][:3]
+                key_words = [w for w in words if w not in TITLE_STOP_WORDS and len(w) > 3][:3]
 
                 if key_words:
                     query = f"{' '.join(key_words)} {author_names[0]}"
                     params = {
                         'query': query,
                         'rows': 3,
-                        'select': 'DOI,title,author,published,container-title,volume,issue,page,publisher,ISBN,ISSN,type'
+                        'select': CROSSREF_SELECT
                     }
 
-                    response = requests.get(search_url, params=params, headers=headers, timeout=10)
-                    response.raise_for_status()
-                    data = response.json()
+                    data = self._get_json(search_url, params=params)
 
                     if data.get('message') and data['message'].get('items'):
                         for result in data['message']['items'][:3]:
                             doi = result.get('DOI', '')
                             if doi and doi not in seen_dois:
                                 seen_dois.add(doi)
-
-                                suggestion_title = ''.join(result.get('title', []))
-                                suggestion_authors = []
-                                for author in result.get('author', [])[:3]:
-                                    given = author.get('given', '')
-                                    family = author.get('family', '')
-                                    if given and family:
-                                        suggestion_authors.append(f"{given} {family}")
-                                    elif family:
-                                        suggestion_authors.append(family)
-
-                                published = result.get('published', {}) or result.get('published-print', {})
-                                suggestion_year = 'N/A'
-                                if published and 'date-parts' in published and published['date-parts']:
-                                    date_parts = published['date-parts'][0]
-                                    if date_parts and len(date_parts) > 0:
-                                        suggestion_year = str(date_parts[0])
-
-                                container_title = result.get('container-title', [])
-                                suggestion_journal = container_title[0] if container_title else 'N/A'
-
-                                self.suggestions.append({
-                                    'entry_id': key,
-                                    'source': 'crossref',
-                                    'suggestion': suggestion_title,
-                                    'authors': ', '.join(suggestion_authors) if suggestion_authors else 'N/A',
-                                    'year': suggestion_year,
-                                    'journal': suggestion_journal,
-                                    'doi': result.get('DOI', 'N/A'),
-                                    'strategy': 'author_keywords'
-                                })
+                                self.suggestions.append(self._crossref_suggestion(key, result, 'author_keywords'))
 
             return None
         except Exception as e:
@@ -1258,15 +1554,16 @@ class BibTeXAPIChecker:
             params = {
                 'query': title,
                 'limit': 1,
-                'fields': 'title,authors,year,venue,doi,publicationTypes,externalIds'
+                'fields': SEMANTIC_SCHOLAR_FIELDS
             }
-            headers = {'User-Agent': 'biblatex-diagnostics/1.0'}
-            if SEMANTIC_SCHOLAR_API_KEY:
-                headers['x-api-key'] = SEMANTIC_SCHOLAR_API_KEY
 
-            response = requests.get(search_url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            # Prefer the record prefetched by DOI over a fuzzy title search
+            doi = entry.fields.get('doi', '').strip().lower()
+            record = self.s2_records.get(doi) if doi else None
+            if record is not None:
+                data = {'data': [record]}
+            else:
+                data = self._get_json(search_url, params=params, headers=self._semantic_scholar_headers())
 
             if data.get('data') and len(data['data']) > 0:
                 result = data['data'][0]
@@ -1275,7 +1572,7 @@ class BibTeXAPIChecker:
 
                 if self._titles_match(entry_title, ss_title):
                     self.log(f"✓ Match found on Semantic Scholar")
-                    self.matches.append({
+                    self._record_match({
                         'entry_id': key,
                         'source': 'semantic_scholar',
                         'title': title,
@@ -1339,7 +1636,7 @@ class BibTeXAPIChecker:
                         'doi': result.get('pub_url', ''),  # Scholarly doesn't always provide DOI
                     }
 
-                    self.matches.append({
+                    self._record_match({
                         'entry_id': key,
                         'source': 'scholarly',
                         'title': title,
@@ -1510,6 +1807,12 @@ class BibTeXAPIChecker:
         print(f"\nValidating {total} entries against APIs ({api_list})...")
         print("=" * 60)
 
+        entries = [entry for entry in bib_data.entries.values()
+                   if (entry.type or '').lower() not in SKIPPED_ENTRY_TYPES and is_searchable(entry)]
+        self.prefetch_crossref_dois(entries)
+        self.prefetch_semantic_scholar_dois(entries)
+        self.prefetch_crossref_titles(entries)
+
         for idx, (key, entry) in enumerate(bib_data.entries.items(), 1):
             print(f"\n[{idx}/{total}] Checking: {key}")
 
@@ -1517,22 +1820,26 @@ class BibTeXAPIChecker:
                 print(f"  - Skipping entry type '{entry.type}' for API checks")
                 continue
 
+            if not is_searchable(entry):
+                # A placeholder title would only bring back unrelated suggestions
+                print("  - No DOI and no usable title, skipping API search")
+                self.not_found.append(key)
+                continue
+
             # Try Crossref first (most reliable and comprehensive)
             crossref_found = self.check_crossref(key, entry, update=False)
-            time.sleep(self.delay)
 
             # Fallback to Semantic Scholar if Crossref didn't find it
-            if not crossref_found and not any(m['entry_id'] == key and m['source'] == 'crossref' for m in self.matches):
+            if not crossref_found and key not in self.matched_keys_by_source.get('crossref', ()):
                 self.check_semantic_scholar(key, entry, update=False)
-                time.sleep(1.0 if SEMANTIC_SCHOLAR_API_KEY else 5.0)
 
             # Final fallback to Google Scholar if neither Crossref nor Semantic Scholar found it
-            if self.use_scholarly and not any(m['entry_id'] == key for m in self.matches):
+            if self.use_scholarly and key not in self.matched_keys:
                 self.check_scholarly(key, entry, update=False)
                 time.sleep(2.0)  # Be respectful to Google Scholar
 
             # Track if not found in any of the APIs
-            if not any(m['entry_id'] == key for m in self.matches):
+            if key not in self.matched_keys:
                 self.not_found.append(key)
 
     def add_missing_fields(self, bib_data: BibliographyData,
@@ -1612,6 +1919,8 @@ class BibTeXAPIChecker:
 
         print("=" * 60)
 
+        self.prefetch_crossref_dois([entry for _, entry, _ in entries_to_process])
+
         updated_count = 0
         crossref_count = 0
         scholarly_count = 0
@@ -1631,12 +1940,7 @@ class BibTeXAPIChecker:
             # Try Crossref API first (using DOI for exact match)
             try:
                 self.log(f"Querying Crossref for DOI: {doi}")
-                doi_url = f"{CROSSREF_API_BASE}/works/{doi}"
-                headers = {'User-Agent': f'biblatex-diagnostics/1.0 (mailto:{MAILTO_EMAIL})'}
-
-                response = requests.get(doi_url, headers=headers, timeout=10)
-                response.raise_for_status()
-                data = response.json()
+                data = self._get_crossref_doi(doi)
 
                 if data.get('message'):
                     result = data['message']
@@ -1655,8 +1959,8 @@ class BibTeXAPIChecker:
                         self.log("✓ No local title, trusting DOI match")
                     elif api_title and entry_title_lower:
                         # Remove punctuation and compare word overlap
-                        entry_words = set(re.sub(r'[^\w\s]', '', entry_title_lower).split())
-                        api_words = set(re.sub(r'[^\w\s]', '', api_title).split())
+                        entry_words = title_words(entry_title_lower)
+                        api_words = title_words(api_title)
                         if entry_words and api_words:
                             overlap = len(entry_words & api_words) / len(entry_words | api_words)
                             if overlap > 0.7:  # 70% word overlap for minor differences (caps, punctuation, spacing)
@@ -1705,8 +2009,6 @@ class BibTeXAPIChecker:
                 self.log(f"Crossref error: {str(e)}")
                 print(f"  - Crossref query failed: {str(e)}")
 
-            time.sleep(self.delay)
-
             # If any fields are still missing, try Scholarly API as fallback
             if fields_still_missing and self.use_scholarly and self.scholarly_session_active and title:
                 # Random delay before Scholarly query (5-12 seconds) to avoid rate limiting
@@ -1721,9 +2023,9 @@ class BibTeXAPIChecker:
                     # Scholarly doesn't understand LaTeX, so we need to normalize it
                     search_title = title
                     # Remove common LaTeX commands and braces
-                    search_title = re.sub(r'\{([^}]*)\}', r'\1', search_title)  # Remove braces but keep content
-                    search_title = re.sub(r'\\[a-zA-Z]+\{([^}]*)\}', r'\1', search_title)  # Remove \command{text}
-                    search_title = re.sub(r'\\[a-zA-Z]+', '', search_title)  # Remove other commands
+                    search_title = _RE_BRACED.sub(r'\1', search_title)  # Remove braces but keep content
+                    search_title = _RE_COMMAND_ARG.sub(r'\1', search_title)  # Remove \command{text}
+                    search_title = _RE_COMMAND.sub('', search_title)  # Remove other commands
                     search_title = search_title.replace('--', '-')  # Double dash to single
                     search_title = ' '.join(search_title.split())  # Normalize whitespace
 
@@ -1761,8 +2063,8 @@ class BibTeXAPIChecker:
                         self.log(f"Comparing with: '{entry_title}'")
 
                         # Relaxed title matching for Scholarly
-                        entry_words = set(re.sub(r'[^\w\s]', '', entry_title).split())
-                        gs_words = set(re.sub(r'[^\w\s]', '', gs_title).split())
+                        entry_words = title_words(entry_title)
+                        gs_words = title_words(gs_title)
                         overlap = 0
                         if entry_words and gs_words:
                             overlap = len(entry_words & gs_words) / len(entry_words | gs_words)
@@ -1849,23 +2151,33 @@ class BibTeXAPIChecker:
         print(f"\nUpdating {total} entries with API data...")
         print("=" * 60)
 
-        updated_count = 0
+        entries = [entry for entry in bib_data.entries.values()
+                   if (entry.type or '').lower() not in SKIPPED_ENTRY_TYPES and is_searchable(entry)]
+        self.prefetch_crossref_dois(entries)
+        self.prefetch_semantic_scholar_dois(entries)
+        self.prefetch_crossref_titles(entries)
+
         crossref_count = 0
         semantic_scholar_count = 0
+        # Replacements are applied after the loop, so the entries can be iterated in place
+        updates = {}
 
-        for idx, (key, entry) in enumerate(list(bib_data.entries.items()), 1):
+        for idx, (key, entry) in enumerate(bib_data.entries.items(), 1):
             print(f"\n[{idx}/{total}] Processing: {key}")
 
             if (entry.type or '').lower() in SKIPPED_ENTRY_TYPES:
                 print(f"  - Skipping entry type '{entry.type}' for API updates")
                 continue
 
+            if not is_searchable(entry):
+                print("  - No DOI and no usable title, skipping API search")
+                continue
+
             # Try Crossref first
             updated_entry = self.check_crossref(key, entry, update=True)
             if updated_entry:
                 crossref_count += 1
                 print(f"  ✓ Updated with Crossref data")
-            time.sleep(self.delay)
 
             # Fallback to Semantic Scholar
             if not updated_entry:
@@ -1873,16 +2185,17 @@ class BibTeXAPIChecker:
                 if updated_entry:
                     semantic_scholar_count += 1
                     print(f"  ✓ Updated with Semantic Scholar data")
-                time.sleep(1.0 if SEMANTIC_SCHOLAR_API_KEY else 5.0)
 
             if updated_entry:
-                bib_data.entries[key] = updated_entry
-                updated_count += 1
+                updates[key] = updated_entry
             else:
                 print(f"  ✗ No update available")
 
+        for key, updated_entry in updates.items():
+            bib_data.entries[key] = updated_entry
+
         print(f"\n{'=' * 60}")
-        print(f"Updated {updated_count}/{total} entries")
+        print(f"Updated {len(updates)}/{total} entries")
         print(f"  - Crossref: {crossref_count}")
         print(f"  - Semantic Scholar: {semantic_scholar_count}")
 
@@ -1931,8 +2244,8 @@ class BibTeXAPIChecker:
             title_similarity = 0
             if entry_title and sug_title:
                 # Calculate word overlap
-                entry_words = set(re.sub(r'[^\w\s]', '', entry_title).split())
-                sug_words = set(re.sub(r'[^\w\s]', '', sug_title).split())
+                entry_words = title_words(entry_title)
+                sug_words = title_words(sug_title)
                 if entry_words and sug_words:
                     title_similarity = len(entry_words & sug_words) / len(entry_words | sug_words)
 
@@ -2000,36 +2313,35 @@ class BibTeXAPIChecker:
         # Return just the suggestions (without scores and similarity)
         return [sug for score, sug, similarity in scored_suggestions]
 
-    def generate_report(self, bib_data: Optional[BibliographyData] = None) -> str:
-        """Generate validation report."""
-        report = []
-        report.append("\n" + "=" * 60)
-        report.append("BIBTEX API VALIDATION REPORT")
-        report.append("=" * 60)
+    def _report_lines(self, bib_data: Optional[BibliographyData] = None):
+        """Yield the lines of the validation report."""
+        yield "\n" + "=" * 60
+        yield "BIBTEX API VALIDATION REPORT"
+        yield "=" * 60
 
-        report.append(f"\nMatches: {len(self.matches)}")
+        yield f"\nMatches: {len(self.matches)}"
         for match in self.matches:
-            report.append(f"  ✓ {match['entry_id']}: Found on {match['source']}")
+            yield f"  ✓ {match['entry_id']}: Found on {match['source']}"
 
         if self.field_mismatches:
-            report.append(f"\nField Mismatches: {len(self.field_mismatches)}")
+            yield f"\nField Mismatches: {len(self.field_mismatches)}"
             for fm in self.field_mismatches:
-                report.append(f"  ⚠ {fm['entry_id']} ({fm['source']}):")
+                yield f"  ⚠ {fm['entry_id']} ({fm['source']}):"
                 for issue in fm['issues']:
-                    report.append(f"      - {issue}")
+                    yield f"      - {issue}"
 
         if self.mismatches:
-            report.append(f"\nTitle Mismatches: {len(self.mismatches)}")
+            yield f"\nTitle Mismatches: {len(self.mismatches)}"
             for mm in self.mismatches:
-                report.append(f"  ⚠ {mm['entry_id']}: '{mm['title']}' != '{mm['api_title']}'")
+                yield f"  ⚠ {mm['entry_id']}: '{mm['title']}' != '{mm['api_title']}'"
 
         if self.not_found:
-            report.append(f"\nNot Found: {len(self.not_found)}")
+            yield f"\nNot Found: {len(self.not_found)}"
             for nf in self.not_found:
-                report.append(f"  ✗ {nf}: Not found in any API")
+                yield f"  ✗ {nf}: Not found in any API"
 
         if self.suggestions:
-            report.append(f"\nSuggestions (possible matches): {len(self.suggestions)}")
+            yield f"\nSuggestions (possible matches): {len(self.suggestions)}"
             # Group suggestions by entry_id
             by_entry = {}
             for sug in self.suggestions:
@@ -2043,18 +2355,29 @@ class BibTeXAPIChecker:
                 if bib_data:
                     entry_suggestions = self._rank_suggestions(entry_id, entry_suggestions, bib_data)
 
-                report.append(f"\n  💡 {entry_id} - Did you mean one of these?")
+                yield f"\n  💡 {entry_id} - Did you mean one of these?"
                 for idx, sug in enumerate(entry_suggestions[:5], 1):  # Show up to 5 suggestions
-                    report.append(f"      [{idx}] {sug['suggestion']}")
-                    report.append(f"          Authors: {sug['authors']}")
-                    report.append(f"          Year: {sug['year']}")
-                    report.append(f"          Journal: {sug['journal']}")
-                    report.append(f"          DOI: {sug['doi']}")
+                    yield f"      [{idx}] {sug['suggestion']}"
+                    yield f"          Authors: {sug['authors']}"
+                    yield f"          Year: {sug['year']}"
+                    yield f"          Journal: {sug['journal']}"
+                    yield f"          DOI: {sug['doi']}"
                     strategy_label = sug.get('strategy', 'title_search')
-                    report.append(f"          (Found via: {strategy_label})")
+                    yield f"          (Found via: {strategy_label})"
 
-        report.append("\n" + "=" * 60)
-        return "\n".join(report)
+        yield "\n" + "=" * 60
+
+    def generate_report(self, bib_data: Optional[BibliographyData] = None) -> str:
+        """Generate validation report."""
+        return "\n".join(self._report_lines(bib_data))
+
+    def write_report(self, f, bib_data: Optional[BibliographyData] = None):
+        """Stream the validation report to an open text file, line by line."""
+        lines = self._report_lines(bib_data)
+        f.write(next(lines))
+        for line in lines:
+            f.write("\n")
+            f.write(line)
 
 
 def main():
@@ -2080,6 +2403,9 @@ Examples:
 
   # Disable Google Scholar (use only Crossref and Semantic Scholar)
   python biblatex_diagnostics.py input.bib --no-scholarly
+
+  # Ignore cached API responses and query everything again
+  python biblatex_diagnostics.py input.bib --no-cache
         """
     )
 
@@ -2087,8 +2413,9 @@ Examples:
     parser.add_argument('-o', '--output', help='Output file for corrected BibTeX')
     parser.add_argument('-r', '--report-file', help='Save validation report to file')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
-    parser.add_argument('--delay', type=float, default=0.05,
-                       help='Delay between Crossref queries (default: 0.05s for 20 req/sec)')
+    parser.add_argument('--delay', type=float, default=CROSSREF_DELAY,
+                       help='Delay between Crossref queries (default: 0.02s with CROSSREF_MAILTO set, '
+                            'otherwise 0.05s)')
     parser.add_argument('--update', action='store_true',
                        help='Update entries with API data (requires -o)')
     parser.add_argument('--add-missing-fields', action='store_true',
@@ -2100,6 +2427,14 @@ Examples:
                             '(default: pages number volume)')
     parser.add_argument('--no-scholarly', action='store_true',
                        help='Disable Google Scholar API (only use Crossref and Semantic Scholar)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                       help=f'Concurrent Crossref title searches (default: {DEFAULT_WORKERS}; '
+                            '1 disables; requests are still paced by --delay)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always query the APIs instead of reusing responses cached in '
+                            '~/.cache/biblatex_check (cached responses expire after 30 days)')
+    parser.add_argument('--refresh-cache', action='store_true',
+                       help='Query the APIs again and replace the cached responses')
 
     args = parser.parse_args()
 
@@ -2120,7 +2455,9 @@ Examples:
         args.report_file = clean_filepath(args.report_file)
 
     # Initialize checker
-    checker = BibTeXAPIChecker(verbose=args.verbose, delay=args.delay, use_scholarly=not args.no_scholarly)
+    checker = BibTeXAPIChecker(verbose=args.verbose, delay=args.delay, use_scholarly=not args.no_scholarly,
+                               use_cache=not args.no_cache, workers=args.workers,
+                               refresh_cache=args.refresh_cache)
 
     try:
         # Load BibTeX file
@@ -2145,13 +2482,13 @@ Examples:
 
         # Generate report (only for validation mode)
         if not args.update and not args.add_missing_fields:
-            report = checker.generate_report(bib_data)
             if args.report_file:
                 with open(args.report_file, 'w', encoding='utf-8') as f:
-                    f.write(report)
+                    checker.write_report(f, bib_data)
                 print(f"\n✓ Validation report saved to: {args.report_file}")
             else:
-                print(report)
+                checker.write_report(sys.stdout, bib_data)
+                sys.stdout.write("\n")
 
     except FileNotFoundError:
         print(f"Error: File '{args.input_file}' not found")
@@ -11,6 +11,11 @@ import argparse
 from typing import List, Tuple, Dict, Set
 from collections import defaultdict
 
+# Precompiled line patterns (each runs once per line of the file)
+_RE_TRAILING_COMMA = re.compile(r',\s*$')
+_RE_UNESCAPED_AMPERSAND = re.compile(r'(?<!\\)&(?!amp;)')
+_RE_DOUBLE_AND = re.compile(r'\band\s+and\b', re.IGNORECASE)
+
 
 def clean_filepath(filepath: str) -> str:
     """
@@ -37,6 +42,9 @@ def clean_filepath(filepath: str) -> str:
 class SyntaxIssue:
     """Represents a syntax issue in a BibTeX file."""
 
+    # One instance per reported problem, so skip the per-instance __dict__
+    __slots__ = ('line_num', 'severity', 'message', 'context')
+
     def __init__(self, line_num: int, severity: str, message: str, context: str = ""):
         self.line_num = line_num
         self.severity = severity  # 'ERROR' or 'WARNING'
@@ -191,7 +199,7 @@ class BibTeXSyntaxChecker:
                 in_multiline_field = False
                 multiline_brace_count = 0
                 # Check if entry starts without a comma after key
-                if not re.search(r',\s*$', line):
+                if not _RE_TRAILING_COMMA.search(line):
                     # Could be on the same line or next line - check next line
                     if line_num < len(self.lines):
                         next_line = self.lines[line_num]
@@ -235,7 +243,7 @@ class BibTeXSyntaxChecker:
                             # If next line is a field, current line needs comma
                             # If next line is closing brace, comma is optional (last field)
                             if field_pattern.match(next_line):
-                                if not re.search(r',\s*$', line):
+                                if not _RE_TRAILING_COMMA.search(line):
                                     self.issues.append(SyntaxIssue(
                                         line_num,
                                         "ERROR",
@@ -254,7 +262,7 @@ class BibTeXSyntaxChecker:
                                 # If next line is a field, current line needs comma
                                 # If next line is closing brace, comma is optional (last field)
                                 if field_pattern.match(next_line):
-                                    if not re.search(r',\s*$', line):
+                                    if not _RE_TRAILING_COMMA.search(line):
                                         self.issues.append(SyntaxIssue(
                                             line_num,
                                             "ERROR",
@@ -320,7 +328,7 @@ class BibTeXSyntaxChecker:
             if inside_entry:
                 # Check for unescaped ampersands (but not in URLs)
                 if '&' in line and 'url' not in line.lower() and 'doi' not in line.lower():
-                    if re.search(r'(?<!\\)&(?!amp;)', line):
+                    if _RE_UNESCAPED_AMPERSAND.search(line):
                         self.issues.append(SyntaxIssue(
                             line_num,
                             "WARNING",
@@ -351,7 +359,7 @@ class BibTeXSyntaxChecker:
                 if author_match:
                     author_value = author_match.group(1)
                     # Check for double "and" (e.g., "and and")
-                    if re.search(r'\band\s+and\b', author_value, re.IGNORECASE):
+                    if _RE_DOUBLE_AND.search(author_value):
                         self.issues.append(SyntaxIssue(
                             line_num,
                             "ERROR",